@@ -4,6 +4,7 @@ from typing import Optional, Text, Tuple, Union
 
 from causalimpact_gibbs import indices
 from causalimpact_gibbs import standardize
+import numpy as np
 import pandas as pd
 import tensorflow as tf
 import tensorflow_probability as tfp
@@ -80,9 +81,10 @@ class CausalImpactData:
           standardize_data: If covariates and output should be standardized.
           dtype: The dtype to use throughout computation.
         """
-        # This is a no-op in case data is a pd.DataFrame. It is common enough to
-        # pass a pd.Series that this is useful here.
-        data = pd.DataFrame(data)
+        # It is common enough to pass a pd.Series that converting is useful here;
+        # DataFrames are used as they are.
+        if not isinstance(data, pd.DataFrame):
+            data = pd.DataFrame(data, copy=False)
         self.pre_intervention_period, self.post_intervention_period = indices.parse_and_validate_date_data(
             data=data, pre_intervention_period=pre_intervention_period,
             post_intervention_period=post_intervention_period)
@@ -90,21 +92,36 @@ class CausalImpactData:
             _validate_data_and_columns(data, target_col_name))
         del data  # To insure the unfiltered DataFrame is not used again.
         self.standardize_data = standardize_data
-        self.pre_intervention_data = self.data.loc[(self.data.index >= self.pre_intervention_period[0])
-                                                   & (self.data.index <= self.pre_intervention_period[1])]
         # after_pre_data intentionally includes everything after the end of the
         # pre-period since the time between pre- and post-period needs to be
         # accounted for and we actually want to see predictions after the post
         # period.
-        self.after_pre_intervention_data = self.data.loc[self.data.index > self.pre_intervention_period[1]]
-        self.num_steps_forecast = len(self.after_pre_intervention_data.index)
-
+        index = self.data.index
+        if index.is_monotonic_increasing:
+            # Binary search for the period boundaries and slice, rather than
+            # building a boolean mask over the whole index for each subset.
+            pre_start = index.searchsorted(self.pre_intervention_period[0], side="left")
+            pre_stop = index.searchsorted(self.pre_intervention_period[1], side="right")
+            self.pre_intervention_data = self.data.iloc[pre_start:pre_stop]
+            self.after_pre_intervention_data = self.data.iloc[pre_stop:]
+            self.num_steps_forecast = len(index) - pre_stop
+        else:
+            self.pre_intervention_data = self.data.loc[(index >= self.pre_intervention_period[0])
+                                                       & (index <= self.pre_intervention_period[1])]
+            self.after_pre_intervention_data = self.data.loc[index > self.pre_intervention_period[1]]
+            self.num_steps_forecast = len(self.after_pre_intervention_data)
+
+        # The model consumes the normalized data in `dtype`, so the scaler
+        # casts its float64 result straight to it.
+        numpy_dtype = tf.as_dtype(dtype).as_numpy_dtype
         if self.standardize_data:
             scaler = standardize.Scaler().fit(self.pre_intervention_data)
             self.outcome_scaler = standardize.Scaler().fit(
                 self.pre_intervention_data[self.target_col])
-            self.normalized_pre_intervention_data = scaler.transform(self.pre_intervention_data)
-            self.normalized_after_pre_intervention_data = scaler.transform(self.after_pre_intervention_data)
+            self.normalized_pre_intervention_data = scaler.transform(
+                self.pre_intervention_data, dtype=numpy_dtype)
+            self.normalized_after_pre_intervention_data = scaler.transform(
+                self.after_pre_intervention_data, dtype=numpy_dtype)
         else:
             self.outcome_scaler = None
             self.normalized_pre_intervention_data = self.pre_intervention_data
@@ -112,23 +129,53 @@ class CausalImpactData:
         if drop_post_period_nan:
             self.normalized_after_pre_intervention_data = self.normalized_after_pre_intervention_data.dropna()
 
-        normalized_pre_intervention_target_tf_tensor = tf.convert_to_tensor(
-            self.normalized_pre_intervention_data[self.target_col], dtype=dtype)
+        # Build the missing-value mask in NumPy; it is a trivial check that does
+        # not need a TensorFlow op.
+        normalized_pre_intervention_target = self.normalized_pre_intervention_data[self.target_col].to_numpy(
+            dtype=numpy_dtype)
         self.pre_intervention_target_ts = tfp.sts.MaskedTimeSeries(
-            time_series=normalized_pre_intervention_target_tf_tensor,
-            is_missing=tf.math.is_nan(normalized_pre_intervention_target_tf_tensor))
+            time_series=tf.constant(normalized_pre_intervention_target),
+            is_missing=tf.constant(np.isnan(normalized_pre_intervention_target)))
         if self.feature_columns is not None:
             # Here we have to use the FULL time series so that the post-period
             # feature data can be used for forecasting.
-            normalized_pre_intervention_features = self.normalized_pre_intervention_data[self.feature_columns]
-            normalized_post_intervention_features = self.normalized_after_pre_intervention_data[self.feature_columns]
-            self.normalized_whole_period_features = pd.concat(
-                [normalized_pre_intervention_features, normalized_post_intervention_features], axis=0)
-            self.normalized_whole_period_features["intercept_"] = 1.
+            self.normalized_whole_period_features = _stack_features_with_intercept(
+                self.normalized_pre_intervention_data[self.feature_columns],
+                self.normalized_after_pre_intervention_data[self.feature_columns],
+                numpy_dtype)
         else:
             self.normalized_whole_period_features = None
 
 
+def _stack_features_with_intercept(pre_features: pd.DataFrame,
+                                   post_features: pd.DataFrame,
+                                   dtype=np.float64) -> pd.DataFrame:
+    """Stacks pre- and post-period features and appends an intercept column.
+
+    The result is written into a single preallocated array, instead of
+    concatenating the frames and then inserting the intercept, which copies the
+    features twice and leaves a fragmented frame.
+
+    Args:
+      pre_features: Feature columns over the pre-period.
+      post_features: The same feature columns over the time after the
+        pre-period.
+      dtype: NumPy dtype of the result.
+
+    Returns:
+      DataFrame of `dtype` with the rows of `pre_features` followed by those of
+      `post_features`, and an "intercept_" column of ones.
+    """
+    num_pre, num_features = pre_features.shape
+    values = np.empty((num_pre + len(post_features), num_features + 1), dtype=dtype)
+    values[:num_pre, :num_features] = pre_features.to_numpy(dtype=dtype)
+    values[num_pre:, :num_features] = post_features.to_numpy(dtype=dtype)
+    values[:, num_features] = 1.
+    return pd.DataFrame(values,
+                        index=pre_features.index.append(post_features.index),
+                        columns=list(pre_features.columns) + ["intercept_"])
+
+
 def _validate_data_and_columns(data: pd.DataFrame,
                                target_column_name: Optional[str]):
     """Validates data and sets defaults for feature and outcome columns.
@@ -142,7 +189,8 @@ def _validate_data_and_columns(data: pd.DataFrame,
 
     Raises:
       KeyError: if `outcome_column` is not in the data.
-      ValueError: if `outcome_column` is constant.
+      ValueError: if `outcome_column` is constant, the data is not numeric, has
+        fewer than 3 observations or the features have missing values.
 
     Returns:
       The validated (possibly default) data, outcome column, and feature columns.
@@ -155,10 +203,6 @@ def _validate_data_and_columns(data: pd.DataFrame,
         raise KeyError(f"Specified `outcome_column` ({target_column_name}) not found "
                        f"in data")
 
-    # Make sure outcome column is not constant
-    if data[target_column_name].std(skipna=True, ddof=0) == 0:
-        raise ValueError("Input response cannot be constant.")
-
     # Feature columns are all those other than the output column. Use
     # `original_column_order` to keep track of the
     # original column order, since set(data.columns) reorders the
@@ -171,12 +215,25 @@ def _validate_data_and_columns(data: pd.DataFrame,
         feature_columns = [
             col for col in original_column_order if col in column_differences
         ]
-    data = data[[target_column_name] + (feature_columns or [])]
-    if data[target_column_name].count() < 3:  # Series.count() is for non-NaN values.
+    # Only reorder the columns if needed; selecting them copies the whole frame.
+    column_order = [target_column_name] + (feature_columns or [])
+    if list(data.columns) != column_order:
+        data = data[column_order]
+    # Wide frames usually share a handful of dtypes, so check each one once.
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in set(data.dtypes)):
+        raise ValueError("Input data must contain only numeric values.")
+
+    # Run the remaining checks on a single float array and NaN mask rather than
+    # scanning the frame once per check. The target is the first column.
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    is_nan = np.isnan(values)
+    num_observations = len(values) - np.count_nonzero(is_nan[:, 0])
+    # Make sure outcome column is not constant
+    if num_observations and np.nanvar(values[:, 0]) == 0:
+        raise ValueError("Input response cannot be constant.")
+    if num_observations < 3:
         raise ValueError("Input data must have at least 3 observations.")
-    if data[feature_columns or []].isna().values.any():
+    if is_nan[:, 1:].any():
         raise ValueError("Input data cannot have any missing values.")
-    if not data.dtypes.map(pd.api.types.is_numeric_dtype).all():
-        raise ValueError("Input data must contain only numeric values.")
 
     return data, target_column_name, feature_columns
@@ -91,6 +91,21 @@ class DataCreationTest(parameterized.TestCase):
     self.assertTrue(ci_data.pre_intervention_data.index.equals(pre_index))
     self.assertTrue(ci_data.after_pre_intervention_data.index.equals(post_index))
 
+  def testDecreasingIndex(self):
+    ci_data = cid.CausalImpactData(
+        self._data.iloc[::-1],
+        pre_intervention_period=self._pre_period,
+        post_intervention_period=self._post_period)
+    sliced_data = cid.CausalImpactData(
+        self._data,
+        pre_intervention_period=self._pre_period,
+        post_intervention_period=self._post_period)
+    pd.testing.assert_frame_equal(ci_data.pre_intervention_data.sort_index(),
+                                  sliced_data.pre_intervention_data)
+    pd.testing.assert_frame_equal(
+        ci_data.after_pre_intervention_data.sort_index(),
+        sliced_data.after_pre_intervention_data)
+
   def testFailsWhenOutcomeDoesntExist(self):
     with self.assertRaises(KeyError):
       cid.CausalImpactData(
@@ -123,14 +138,15 @@ class DataCreationTest(parameterized.TestCase):
       pd.testing.assert_series_equal(
           ci_data.normalized_pre_intervention_data.iloc[0],
           pd.Series([-0.718908, 1.684957, 0.705064], index=index,
-                    name=pre_time),
+                    name=pre_time, dtype=np.float32),
           # Allow minor differences due to encoding.
           rtol=0.01)
       pd.testing.assert_series_equal(
           ci_data.normalized_after_pre_intervention_data.iloc[0],
           pd.Series([0.355322, -1.456488, -2.652383],
                     index=index,
-                    name=post_time),
+                    name=post_time,
+                    dtype=np.float32),
           # Allow minor differences due to encoding.
           rtol=0.01)
     else:
@@ -142,6 +158,22 @@ class DataCreationTest(parameterized.TestCase):
           pd.Series([123., 123., 123.], index=index, name=post_time),
       )
 
+  def testWholePeriodFeatures(self):
+    ci_data = cid.CausalImpactData(
+        self._data,
+        pre_intervention_period=self._pre_period,
+        post_intervention_period=self._post_period)
+    features = ci_data.normalized_whole_period_features
+    self.assertListEqual(list(features.columns), ["x1", "x2", "intercept_"])
+    self.assertTrue(features.index.equals(self._data.index))
+    np.testing.assert_array_equal(features["intercept_"], 1.)
+    # The intercept is stored in the model dtype rather than widened to float64.
+    self.assertEqual(features["intercept_"].dtype, np.float32)
+    pd.testing.assert_frame_equal(
+        features.loc[ci_data.normalized_pre_intervention_data.index,
+                     ["x1", "x2"]],
+        ci_data.normalized_pre_intervention_data[["x1", "x2"]])
+
   def testMissingValues(self):
     na_data = self._data.copy()
     na_data.loc[self._treatment_start, "x1"] = np.nan
@@ -149,6 +181,22 @@ class DataCreationTest(parameterized.TestCase):
       cid.CausalImpactData(
           na_data, pre_intervention_period=self._pre_period, post_intervention_period=self._post_period)
 
+  def testConstantResponse(self):
+    constant_data = self._data.copy()
+    constant_data["y"] = 1.
+    with self.assertRaisesRegex(ValueError, "constant"):
+      cid.CausalImpactData(
+          constant_data, pre_intervention_period=self._pre_period,
+          post_intervention_period=self._post_period)
+
+  def testNonNumericValues(self):
+    string_data = self._data.copy()
+    string_data["x1"] = string_data["x1"].astype(str)
+    with self.assertRaisesRegex(ValueError, "numeric"):
+      cid.CausalImpactData(
+          string_data, pre_intervention_period=self._pre_period,
+          post_intervention_period=self._post_period)
+
 
 if __name__ == "__main__":
   absltest.main()
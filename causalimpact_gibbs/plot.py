@@ -14,14 +14,22 @@
 # limitations under the License.
 
 """Plotting causalimpact_gibbs results."""
+import collections
+import contextlib
+import dataclasses
+import functools
 from pprint import pprint
-from typing import Any, Union, Dict
+import re
+import statistics
+import types
+import weakref
+from typing import Any, Union, Dict, Optional, Tuple, TYPE_CHECKING
 
-import altair as alt
 import numpy as np
-import japanize_matplotlib
 import arviz as az
 
+from matplotlib.collections import LineCollection, PolyCollection
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 from matplotlib.ticker import FuncFormatter
 import pandas as pd
@@ -29,6 +37,11 @@ import logging
 
 from causalimpact_gibbs import CausalImpactAnalysis
 
+if TYPE_CHECKING:
+    # altair is imported lazily by the altair drawing functions so matplotlib
+    # users don't pay for it.
+    import altair as alt
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -213,8 +226,284 @@ def _generate_diagnostic_plots(
     logger.info("Diagnostic plots generation completed.")
 
 
+# Figures returned by `plot()`, keyed by `_plot_cache_key` and evicted in
+# least-recently-used order.
+_PLOT_CACHE_SIZE = 8
+_PLOT_CACHE: "collections.OrderedDict[Tuple[int, int, bool, Tuple], Tuple[pd.DataFrame, Any]]" = (
+    collections.OrderedDict())
+
+# Scaling factors applied to tick values for the named y-axis formats.
+_Y_FORMATTER_SCALES = {
+    'millions': 1e-6,
+    'thousands': 1e-3,
+}
+
+
+def _create_y_axis_formatter(format_option, unit):
+    """
+    Create a tick formatter function for the y-axis.
+
+    Formatters are cached on `(format_option, unit)` so repeated plots reuse the
+    same closure. Callables are hashed by identity; unhashable arguments get an
+    uncached formatter.
+
+    Parameters
+    ----------
+    format_option : str or callable
+        'millions', 'thousands', a callable `f(x, pos)`, or any other value to
+        print the raw tick value.
+    unit : str
+        Suffix appended to each tick label.
+
+    Returns
+    -------
+    callable
+        Function `f(x, pos)` suitable for `matplotlib.ticker.FuncFormatter`.
+    """
+    try:
+        return _cached_y_axis_formatter(format_option, unit)
+    except TypeError:
+        return _build_y_axis_formatter(format_option, unit)
+
+
+def _build_y_axis_formatter(format_option, unit):
+    """Builds the formatter described in `_create_y_axis_formatter`."""
+    if callable(format_option):
+        return lambda x, pos: f'{format_option(x, pos)}{unit}'
+    scale = _Y_FORMATTER_SCALES.get(format_option) if isinstance(format_option, str) else None
+    if scale is not None:
+        return lambda x, pos: f'{x * scale:.1f}{unit}'
+    return lambda x, pos: f'{x}{unit}'
+
+
+_cached_y_axis_formatter = functools.lru_cache(maxsize=64)(_build_y_axis_formatter)
+
+
+def _time_to_num(time: pd.Series) -> np.ndarray:
+    """Converts a time column to the float x-coordinates used by Matplotlib."""
+    if pd.api.types.is_datetime64_any_dtype(time):
+        return mdates.date2num(time.to_numpy())
+    return time.to_numpy(dtype=float)
+
+
+def _line_segments(x: np.ndarray, y: pd.Series) -> list:
+    """Returns the `LineCollection` segments for a single series."""
+    return [np.column_stack([x, y.to_numpy(dtype=float)])]
+
+
+def _band_polygons(x: np.ndarray, lower: pd.Series, upper: pd.Series) -> list:
+    """
+    Returns the `PolyCollection` polygons for an uncertainty band.
+
+    Polygons are laid out like `ax.fill_between` does, and time points where
+    either bound is missing split the band into separate polygons.
+    """
+    lower = lower.to_numpy(dtype=float)
+    upper = upper.to_numpy(dtype=float)
+    valid = ~(np.isnan(lower) | np.isnan(upper))
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], valid.astype(np.int8), [0]))))
+    polygons = []
+    for start, stop in zip(edges[::2], edges[1::2]):
+        x_run = x[start:stop]
+        polygons.append(np.concatenate([
+            [[x_run[0], upper[start]]],
+            np.column_stack([x_run, lower[start:stop]]),
+            [[x_run[-1], upper[stop - 1]]],
+            np.column_stack([x_run[::-1], upper[start:stop][::-1]]),
+        ]))
+    return polygons
+
+
+def _add_line_collection(ax, x: np.ndarray, y: pd.Series, label: str, color: str) -> LineCollection:
+    """
+    Draw a single series as a `LineCollection` built directly from arrays.
+
+    This skips the argument parsing and unit conversion `ax.plot` performs while
+    drawing the same line; the styling matches a default `Line2D`.
+    """
+    collection = LineCollection(
+        _line_segments(x, y),
+        colors=[color],
+        label=label,
+        capstyle='projecting',
+        joinstyle='round',
+        zorder=2,
+    )
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def _add_band_collection(ax, x: np.ndarray, lower: pd.Series, upper: pd.Series, color: str) -> PolyCollection:
+    """Draw an uncertainty band as a `PolyCollection`, like `ax.fill_between`."""
+    collection = PolyCollection(_band_polygons(x, lower, upper), color=color, alpha=0.2)
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+# The (scale, stat) partition of the plot data drawn by each matplotlib artist.
+_LINE_ARTISTS = {
+    'mean_line': ("original", "mean"),
+    'observed_line': ("original", "observed"),
+    'pointwise_line': ("point_effects", "mean"),
+    'cumulative_line': ("cumulative_effects", "mean"),
+}
+_BAND_ARTISTS = {
+    'observed_band': ("original", "observed"),
+    'pointwise_band': ("point_effects", "mean"),
+    'cumulative_band': ("cumulative_effects", "mean"),
+}
+
+# Options of `plot()` that only change which rows are drawn. A figure built
+# with otherwise identical options can be reused by updating its artists.
+_DATA_ONLY_PLOT_OPTIONS = frozenset(
+    {"static_plot", "backend", "alpha", "show_median", "use_std_intervals"})
+
+# Defaults of the options read by `_build_fig`.
+_PLOT_OPTS_DEFAULTS = types.MappingProxyType({
+    "chart_width": 800,
+    "chart_height": 600,
+    "x_label": "Time",
+    "y_labels": ("Observed", "Pointwise Effect", "Cumulative Effect"),
+    "title": "",
+    "title_font_size": 14,
+    "axis_title_font_size": 12,
+    "y_formatter": "millions",
+    "y_formatter_unit": "dollar",
+    "legend_labels": types.MappingProxyType({}),
+    "japanese_labels": False,
+})
+
+
+@dataclasses.dataclass(slots=True)
+class _PlotOpts:
+    """The matplotlib figure options, with defaults from `_PLOT_OPTS_DEFAULTS`."""
+    chart_width: int
+    chart_height: int
+    x_label: str
+    y_labels: Any
+    title: str
+    title_font_size: int
+    axis_title_font_size: int
+    y_formatter: Any
+    y_formatter_unit: Any
+    legend_labels: Any
+    japanese_labels: bool
+
+    @classmethod
+    def from_plot_options(cls, plot_options: Dict[str, Any]) -> "_PlotOpts":
+        """Fills in defaults; options the matplotlib figure does not use are ignored."""
+        return cls(**{**_PLOT_OPTS_DEFAULTS,
+                      **{k: v for k, v in plot_options.items() if k in _PLOT_OPTS_DEFAULTS}})
+
+
+# Matplotlib figures and their data artists, keyed by `_figure_reuse_key`. The
+# model is only referenced weakly, so the cache does not keep it alive.
+_FIGURE_CACHE: "collections.OrderedDict[Tuple[int, Tuple, Tuple], Tuple[weakref.ref, Any, Dict[str, Any]]]" = (
+    collections.OrderedDict())
+
+
+def _period_boundaries(data_frame: pd.DataFrame) -> Tuple[Any, Any, Any, Any]:
+    """Returns the (constant) pre/post period start and end of the plot data."""
+    return tuple(data_frame[c].iat[0] for c in
+                 ("pre_period_start", "pre_period_end", "post_period_start", "post_period_end"))
+
+
+def _partition_plot_data(data_frame: pd.DataFrame, x: np.ndarray):
+    """
+    Split the plot data by (scale, stat) in a single pass.
+
+    Parameters
+    ----------
+    data_frame : pd.DataFrame
+        The plot data.
+    x : np.ndarray
+        The Matplotlib x-coordinates of `data_frame["time"]`, see `_time_to_num`.
+
+    Returns
+    -------
+    tuple
+        Dictionary of partitions keyed by (scale, stat), and an empty frame to
+        use for partitions that are absent. Only the columns needed for drawing
+        are carried along, with the time column replaced by its coordinates "x".
+    """
+    plot_frame = data_frame[["value", "lower", "upper", "scale", "stat"]].assign(x=x)
+    groups = {
+        key: group
+        for key, group in plot_frame.groupby(["scale", "stat"], sort=False)
+    }
+    return groups, plot_frame.iloc[:0]
+
+
+def _figure_reuse_key(ci: CausalImpactAnalysis, data_frame: pd.DataFrame,
+                      plot_options: Dict[str, Any]) -> Optional[Tuple[int, Tuple, Tuple]]:
+    """Builds the key under which a model's figure can be reused, or None if it can't be."""
+    layout_options = _hashable_options(
+        {k: v for k, v in plot_options.items() if k not in _DATA_ONLY_PLOT_OPTIONS})
+    if layout_options is None:
+        return None
+    return id(ci), layout_options, _period_boundaries(data_frame)
+
+
+def _update_fig(fig, artists: Dict[str, Any], data_frame: pd.DataFrame):
+    """
+    Redraw a figure from `_build_fig` with new data.
+
+    Only the line and band artists are updated; titles, labels, formatters and
+    period markers are kept. Axis limits are recomputed from the new data and
+    the canvas is redrawn lazily.
+    """
+    groups, empty = _partition_plot_data(data_frame, _time_to_num(data_frame["time"]))
+    for name, key in _LINE_ARTISTS.items():
+        group = groups.get(key, empty)
+        artists[name].set_segments(_line_segments(group["x"].to_numpy(), group["value"]))
+    for name, key in _BAND_ARTISTS.items():
+        group = groups.get(key, empty)
+        artists[name].set_verts(
+            _band_polygons(group["x"].to_numpy(), group["lower"], group["upper"]))
+
+    # `relim` only accounts for lines, so add the collections' extents back in.
+    for ax in artists['axes']:
+        ax.relim()
+        for collection in ax.collections:
+            ax.update_datalim(collection.get_datalim(ax.transData).get_points())
+        ax.autoscale_view()
+    fig.canvas.draw_idle()
+
+
 def _draw_matplotlib_plot(data_frame: pd.DataFrame, ci: CausalImpactAnalysis = None, generate_diagnostic_plots=True,
-                          **plot_options):
+                          reuse_figure=False, **plot_options):
+    """
+    Draw the matplotlib plot, reusing the model's previous figure if possible.
+
+    When `reuse_figure` is set and a figure was already built for `ci` with the
+    same layout options and periods, its data artists are updated in place
+    instead of building a new figure. The diagnostic plots and the summary of
+    `_build_fig` are then skipped. See `_build_fig` for the figure layout.
+    """
+    reuse_key = _figure_reuse_key(ci, data_frame, plot_options) if reuse_figure and ci is not None else None
+    if reuse_key is None:
+        fig, _ = _build_fig(data_frame, ci, generate_diagnostic_plots, **plot_options)
+        return fig
+
+    cached = _FIGURE_CACHE.get(reuse_key)
+    # A dead reference means the id now belongs to a different model.
+    if cached is not None and cached[0]() is ci:
+        _FIGURE_CACHE.move_to_end(reuse_key)
+        fig, artists = cached[1], cached[2]
+        _update_fig(fig, artists, data_frame)
+        return fig
+
+    fig, artists = _build_fig(data_frame, ci, generate_diagnostic_plots, **plot_options)
+    _FIGURE_CACHE[reuse_key] = (weakref.ref(ci), fig, artists)
+    if len(_FIGURE_CACHE) > _PLOT_CACHE_SIZE:
+        _FIGURE_CACHE.popitem(last=False)
+    return fig
+
+
+def _build_fig(data_frame: pd.DataFrame, ci: CausalImpactAnalysis = None, generate_diagnostic_plots=True,
+               **plot_options):
     """
     Generate a customized Matplotlib figure with four subplots:
     1. Observed vs. Mean
@@ -231,11 +520,24 @@ def _draw_matplotlib_plot(data_frame: pd.DataFrame, ci: CausalImpactAnalysis = N
     plot_options : dict, optional
         Dictionary of plotting options. Same as before plus additional
         options for trace plot as needed.
+
+    Returns
+    -------
+    tuple
+        The figure, and a dictionary of its axes and data artists that
+        `_update_fig` uses to redraw the figure with new data.
     """
 
     import matplotlib.pyplot as plt
     from matplotlib.ticker import FuncFormatter
 
+    opts = _PlotOpts.from_plot_options(plot_options)
+
+    # japanize_matplotlib scans for and registers Japanese fonts on import, so
+    # only pay for it when Japanese labels were requested.
+    if opts.japanese_labels:
+        import japanize_matplotlib  # noqa: F401
+
     # ----------------------------- Helper Functions -----------------------------
     def process_y_formatter_units(y_formatter_unit_options, subplot_labels):
         if isinstance(y_formatter_unit_options, str):
@@ -249,31 +551,18 @@ def _draw_matplotlib_plot(data_frame: pd.DataFrame, ci: CausalImpactAnalysis = N
         else:
             raise TypeError("y_formatter_unit must be a string, list, or dict.")
 
-    def create_y_axis_formatter(format_option, unit):
-        if format_option == 'millions':
-            return lambda x, pos: f'{x * 1e-6:.1f}{unit}'
-        elif format_option == 'thousands':
-            return lambda x, pos: f'{x * 1e-3:.1f}{unit}'
-        elif callable(format_option):
-            return lambda x, pos: f'{format_option(x, pos)}{unit}'
-        else:
-            return lambda x, pos: f'{x}{unit}'
-
-    def add_period_markers(ax, df, labels):
-        pre_start = df["pre_period_start"].iloc[0]
-        pre_end = df["pre_period_end"].iloc[0]
-        post_start = df["post_period_start"].iloc[0]
-        post_end = df["post_period_end"].iloc[0]
+    def add_period_markers(ax, periods, labels, has_before_pre, has_gap, has_after_post):
+        pre_start, pre_end, post_start, post_end = periods
 
-        if (df["time"] < pre_start).any():
+        if has_before_pre:
             ax.axvline(pre_start, color="grey", linestyle="--", label=labels['pre_period_start'])
 
-        if ((df["time"] > pre_end) & (df["time"] < post_start)).any():
+        if has_gap:
             ax.axvline(pre_end, color="grey", linestyle="--", label=labels['pre_period_end'])
 
         ax.axvline(post_start, color="grey", linestyle="--", label=labels['post_period_start'])
 
-        if (df["time"] > post_end).any():
+        if has_after_post:
             ax.axvline(post_end, color="grey", linestyle="--", label=labels['post_period_end'])
 
         handles, legend_labels = ax.get_legend_handles_labels()
@@ -282,23 +571,23 @@ def _draw_matplotlib_plot(data_frame: pd.DataFrame, ci: CausalImpactAnalysis = N
                   loc="upper left", fontsize="small", frameon=False)
 
     # ----------------------------- Extract Plot Options -----------------------------
-    chart_width_px = plot_options.get("chart_width", 800)
-    chart_height_px = plot_options.get("chart_height", 600)
+    chart_width_px = opts.chart_width
+    chart_height_px = opts.chart_height
     dpi = 100
     # Now we have 4 subplots (instead of 3), adjust height accordingly
     fig_width_in = chart_width_px / dpi
     fig_height_in = (chart_height_px * 4) / dpi
 
-    x_label = plot_options.get("x_label", "Time")
-    y_labels = plot_options.get("y_labels", ["Observed", "Pointwise Effect", "Cumulative Effect"])
-    plot_title = plot_options.get("title", "")
-    title_font_size = plot_options.get("title_font_size", 14)
-    axis_label_font_size = plot_options.get("axis_title_font_size", 12)
+    x_label = opts.x_label
+    y_labels = list(opts.y_labels)
+    plot_title = opts.title
+    title_font_size = opts.title_font_size
+    axis_label_font_size = opts.axis_title_font_size
 
-    y_formatter_option = plot_options.get("y_formatter", "millions")
-    y_formatter_unit_option = plot_options.get("y_formatter_unit", "dollar")
+    y_formatter_option = opts.y_formatter
+    y_formatter_unit_option = opts.y_formatter_unit
 
-    legend_labels = plot_options.get("legend_labels", {})
+    legend_labels = opts.legend_labels
     legend = {
         'mean': legend_labels.get("mean", "Mean"),
         'observed': legend_labels.get("observed", "Observed"),
@@ -332,14 +621,32 @@ def _draw_matplotlib_plot(data_frame: pd.DataFrame, ci: CausalImpactAnalysis = N
     for ax, y_label in zip(axes, subplot_labels):
         ax.grid(True, linestyle='--', alpha=0.7)
         unit = y_formatter_units.get(y_label, default_unit)
-        formatter = create_y_axis_formatter(y_formatter_option, unit)
+        formatter = _create_y_axis_formatter(y_formatter_option, unit)
         ax.yaxis.set_major_formatter(FuncFormatter(formatter))
         ax.set_ylabel(y_label, fontsize=axis_label_font_size,
                       fontweight="bold", labelpad=10)
 
+    # Convert the time column (and the period boundaries) to Matplotlib's float
+    # x-coordinates once; every subplot draws from the same coordinates.
+    x = _time_to_num(data_frame["time"])
+    periods = _time_to_num(pd.Series(_period_boundaries(data_frame)))
+    is_datetime = pd.api.types.is_datetime64_any_dtype(data_frame["time"])
+
+    # Decide which period markers are needed with binary searches over the
+    # sorted unique time points; the result is shared by all three subplots.
+    pre_start, pre_end, post_start, post_end = periods
+    times = np.unique(x)
+    has_before_pre = times.searchsorted(pre_start, side="left") > 0
+    has_gap = (times.searchsorted(post_start, side="left")
+               > times.searchsorted(pre_end, side="right"))
+    has_after_post = times.searchsorted(post_end, side="right") < len(times)
+
     # Add period markers only to the first 3 subplots which deal with time series data
     for ax in axes[:3]:
-        add_period_markers(ax, data_frame, legend)
+        if is_datetime:
+            # The data is drawn from float coordinates, so label them as dates.
+            ax.xaxis_date()
+        add_period_markers(ax, periods, legend, has_before_pre, has_gap, has_after_post)
 
     # Set the common x-axis label on the last time-series subplot (3rd one)
     axes[2].set_xlabel(x_label, fontsize=axis_label_font_size, fontweight="bold")
@@ -347,55 +654,44 @@ def _draw_matplotlib_plot(data_frame: pd.DataFrame, ci: CausalImpactAnalysis = N
 
     # ----------------------------- Plot Data on Subplots -----------------------------
 
+    # Partition the frame by (scale, stat) in a single pass rather than scanning
+    # it once per subset.
+    groups, empty = _partition_plot_data(data_frame, x)
+    artists = {'axes': axes}
+
     # Subplot 1: Observed vs Mean
-    observed_mask = (data_frame["scale"] == "original") & (data_frame["stat"] == "observed")
-    mean_mask = (data_frame["scale"] == "original") & (data_frame["stat"] == "mean")
-
-    observed_data = data_frame[observed_mask]
-    mean_data = data_frame[mean_mask]
-
-    axes[0].plot(mean_data["time"], mean_data["value"],
-                 label=legend['mean'], color='blue')
-    axes[0].plot(observed_data["time"], observed_data["value"],
-                 label=legend['observed'], color='orange')
-    axes[0].fill_between(
-        observed_data["time"],
-        observed_data["lower"],
-        observed_data["upper"],
-        color='gray',
-        alpha=0.2
-    )
+    observed_data = groups.get(_LINE_ARTISTS['observed_line'], empty)
+    mean_data = groups.get(_LINE_ARTISTS['mean_line'], empty)
+
+    mean_x = mean_data["x"].to_numpy()
+    observed_x = observed_data["x"].to_numpy()
+    artists['mean_line'] = _add_line_collection(
+        axes[0], mean_x, mean_data["value"], legend['mean'], 'blue')
+    artists['observed_line'] = _add_line_collection(
+        axes[0], observed_x, observed_data["value"], legend['observed'], 'orange')
+    artists['observed_band'] = _add_band_collection(
+        axes[0], observed_x, observed_data["lower"], observed_data["upper"], 'gray')
     axes[0].legend(loc="upper left", bbox_to_anchor=(1, 1), fontsize="small", frameon=False)
 
     # Subplot 2: Pointwise Effect
-    pointwise_mask = (data_frame["scale"] == "point_effects") & (data_frame["stat"] == "mean")
-    pointwise_data = data_frame[pointwise_mask]
-
-    axes[1].plot(pointwise_data["time"], pointwise_data["value"],
-                 label=legend['pointwise'], color='green')
-    axes[1].fill_between(
-        pointwise_data["time"],
-        pointwise_data["lower"],
-        pointwise_data["upper"],
-        color='lightgreen',
-        alpha=0.2
-    )
+    pointwise_data = groups.get(_LINE_ARTISTS['pointwise_line'], empty)
+
+    pointwise_x = pointwise_data["x"].to_numpy()
+    artists['pointwise_line'] = _add_line_collection(
+        axes[1], pointwise_x, pointwise_data["value"], legend['pointwise'], 'green')
+    artists['pointwise_band'] = _add_band_collection(
+        axes[1], pointwise_x, pointwise_data["lower"], pointwise_data["upper"], 'lightgreen')
     axes[1].axhline(0, color="grey", linestyle="--", linewidth=1)
     axes[1].legend(loc="upper left", bbox_to_anchor=(1, 1), fontsize="small", frameon=False)
 
     # Subplot 3: Cumulative Effect
-    cumulative_mask = (data_frame["scale"] == "cumulative_effects") & (data_frame["stat"] == "mean")
-    cumulative_data = data_frame[cumulative_mask]
-
-    axes[2].plot(cumulative_data["time"], cumulative_data["value"],
-                 label=legend['cumulative'], color='red')
-    axes[2].fill_between(
-        cumulative_data["time"],
-        cumulative_data["lower"],
-        cumulative_data["upper"],
-        color='salmon',
-        alpha=0.2
-    )
+    cumulative_data = groups.get(_LINE_ARTISTS['cumulative_line'], empty)
+
+    cumulative_x = cumulative_data["x"].to_numpy()
+    artists['cumulative_line'] = _add_line_collection(
+        axes[2], cumulative_x, cumulative_data["value"], legend['cumulative'], 'red')
+    artists['cumulative_band'] = _add_band_collection(
+        axes[2], cumulative_x, cumulative_data["lower"], cumulative_data["upper"], 'salmon')
     axes[2].axhline(0, color="grey", linestyle="--", linewidth=1)
     axes[2].legend(loc="upper left", bbox_to_anchor=(1, 1), fontsize="small", frameon=False)
 
@@ -420,15 +716,29 @@ def _draw_matplotlib_plot(data_frame: pd.DataFrame, ci: CausalImpactAnalysis = N
     # Align y-labels across subplots for a cleaner look
     fig.align_ylabels(axes)
 
-    return fig
+    return fig, artists
 
 
-def plot(ci_model: CausalImpactAnalysis, generate_diagnostic_plots: bool, **kwargs) -> Union[alt.Chart, Any]:
+def plot(ci_model: CausalImpactAnalysis, generate_diagnostic_plots: bool, cache: bool = False,
+         reuse_figure: bool = False, **kwargs) -> Union["alt.Chart", Any]:
     """Main plotting function.
 
     Args:
       ci_model: CausalImpactAnalysis object, after having called
         `fit_causalimpact`.
+      generate_diagnostic_plots: whether the matplotlib backend should also draw
+        the MCMC diagnostic plots.
+      cache: whether to return the figure from a previous call with the same
+        model, series and plot parameters instead of building a new one. The
+        same object is returned to every caller, and a cached figure skips the
+        diagnostic plots and the printed summary. Calls with plot parameters
+        that can't be hashed are never cached. Default = False.
+      reuse_figure: whether the matplotlib backend should redraw the figure
+        from a previous call with the same model, layout options and periods
+        in place instead of building a new one. The previously returned figure
+        then changes as well, and a reused figure skips the diagnostic plots
+        and the printed summary. Figures drawn this way are never kept in the
+        `cache`. Default = False.
       **kwargs: arguments for modifying plot defaults:
         static_plot - whether to return the standard CausalImpact plot as a
           static plot (default) or an interactive plot.
@@ -446,6 +756,19 @@ def plot(ci_model: CausalImpactAnalysis, generate_diagnostic_plots: bool, **kwar
         axis_title_font_size - integer for axis title font size. Default = 18.
         axis_label_font_size - integer for axis title font size. Default = 16.
         strip_title_font_size - integer for facet label font size. Default = 18.
+        japanese_labels - whether to load Japanese fonts for the matplotlib
+          backend. Default = False.
+        vegafusion - whether the altair backend should build and compile the
+          chart with the VegaFusion data transformer, so that the chart's data
+          transforms run in VegaFusion's runtime instead of the browser. The
+          transformer is only enabled for this call, and the chart is returned
+          compiled to Vega as with `compile_to_vega`. Requires the
+          `vegafusion`, `pyarrow` and `vl-convert-python` packages.
+          Default = False.
+        compile_to_vega - whether the altair backend should compile the chart
+          to a Vega spec once, so that renderers skip compiling Vega-Lite each
+          time the plot is displayed. Requires the `vl-convert-python` package.
+          Default = False.
 
     Returns:
       alt.Chart plot object
@@ -473,6 +796,9 @@ def plot(ci_model: CausalImpactAnalysis, generate_diagnostic_plots: bool, **kwar
         "axes0_legend_label_mean": "Mean",
         "axes0_legend_label_observed": "Observed",
         "y_formatter_unit": "dollar",
+        "japanese_labels": False,
+        "vegafusion": False,
+        "compile_to_vega": False,
         "legend_labels": {
             "mean": "Mean",
             "observed": "Observed",
@@ -485,48 +811,103 @@ def plot(ci_model: CausalImpactAnalysis, generate_diagnostic_plots: bool, **kwar
         },
 
     }
-    if kwargs:
-        for k, v in plot_params.items():
-            plot_params[k] = kwargs.get(k, v)
+    plot_params.update(kwargs)
+
+    cache_key = _plot_cache_key(ci_model, generate_diagnostic_plots, plot_params) if cache else None
+    if cache_key is not None:
+        cached = _PLOT_CACHE.get(cache_key)
+        # The cached series is kept alive with the figure, so an identity check
+        # guards against ids being reused by a different series.
+        if cached is not None and cached[0] is ci_model.series:
+            _PLOT_CACHE.move_to_end(cache_key)
+            return cached[1]
 
     # Create the dataframe that will be used to create the plot.
-    main_plot_df = _create_plot_df(ci_model.series, plot_params["alpha"])
+    main_plot_df = _create_plot_df(ci_model.series, plot_params["alpha"],
+                                   plot_params["backend"])
 
     # If use_std_intervals=True, use std to draw the uncertainty intervals,
     # otherwise use the quantile-based intervals. We drop the unnecessary
     # observations instead of keeping the requested ones because dates outside of
     # the pre/post period will have NaN values for band_method.
-    if plot_params["use_std_intervals"]:
-        plot_df = main_plot_df.loc[main_plot_df["band_method"] != "quantile"]
-    else:
-        plot_df = main_plot_df.loc[main_plot_df["band_method"] != "std"]
-
-    # Include median if requested.
-    if plot_params["show_median"]:
-        plot_df = plot_df.loc[plot_df["stat"] != "median"]
+    # All row filters are combined into one mask on the underlying arrays and
+    # applied with a single `take`, which also gives us a frame we own.
+    band_method_arr = main_plot_df["band_method"].to_numpy()
+    keep = band_method_arr != ("quantile" if plot_params["use_std_intervals"] else "std")
+
+    # Include median if requested. The static altair plot never draws it.
+    drop_median = plot_params["show_median"] or (
+            plot_params["backend"] == "altair" and plot_params["static_plot"])
+    if drop_median:
+        keep &= main_plot_df["stat"].to_numpy() != "median"
+    plot_df = main_plot_df.take(np.flatnonzero(keep))
+
+    if plot_params["show_median"] and plot_params["backend"] == "altair":
         plot_df["stat_pretty"] = pd.Categorical(
             plot_df["stat_pretty"], categories=["Observed", "Mean"], ordered=True
         )
 
     # Create the requested plot type.
     if plot_params["backend"] == "altair":
-        if plot_params["static_plot"]:
-            plot_df = plot_df.loc[(plot_df["stat"] != "median")]
-            plt = _draw_classic_plot(plot_df, **plot_params)
-        else:
-            plt = _draw_interactive_plot(plot_df, **plot_params)
+        # VegaFusion only takes effect while the chart is serialized, so the
+        # chart is compiled before the transformer is restored.
+        with _vegafusion_enabled(plot_params["vegafusion"]):
+            if plot_params["static_plot"]:
+                plt = _draw_classic_plot(plot_df, **plot_params)
+            else:
+                plt = _draw_interactive_plot(plot_df, **plot_params)
+            if plot_params["compile_to_vega"] or plot_params["vegafusion"]:
+                plt = _VegaChart(plt.to_dict(format="vega"))
     elif plot_params["backend"] == "matplotlib":
         plt = _draw_matplotlib_plot(plot_df, ci=ci_model, generate_diagnostic_plots=generate_diagnostic_plots,
-                                    **plot_params)
+                                    reuse_figure=reuse_figure, **plot_params)
     else:
         raise ValueError(
             "backend must be one of 'altair' or 'matplotlib'. Got"
             f" {plot_params['backend']}."
         )
+    # A figure that may be redrawn in place by a later call must not be cached.
+    if cache_key is not None and not (reuse_figure and plot_params["backend"] == "matplotlib"):
+        _PLOT_CACHE[cache_key] = (ci_model.series, plt)
+        if len(_PLOT_CACHE) > _PLOT_CACHE_SIZE:
+            _PLOT_CACHE.popitem(last=False)
     return plt
 
 
-def _create_plot_df(series: pd.DataFrame, alpha: float = 0.05) -> pd.DataFrame:
+def _plot_cache_key(ci_model: CausalImpactAnalysis, generate_diagnostic_plots: bool,
+                    plot_params: Dict[str, Any]) -> Optional[Tuple[int, int, bool, Tuple]]:
+    """Builds the `plot()` cache key, or returns None if an option is unhashable."""
+    params_key = _hashable_options(plot_params)
+    if params_key is None:
+        return None
+    return id(ci_model), id(ci_model.series), bool(generate_diagnostic_plots), params_key
+
+
+def _hashable_options(options: Dict[str, Any]) -> Optional[Tuple]:
+    """
+    Converts plot options into a hashable tuple, or returns None if one can't be hashed.
+
+    Lists and dicts are converted to tuples tagged with their type. Other values
+    are used as they are, so callables compare by identity; the key keeps them
+    alive, so their ids can't be taken over by another object.
+    """
+    def freeze(value):
+        if isinstance(value, dict):
+            return dict, tuple((k, freeze(v)) for k, v in sorted(value.items(), key=lambda kv: str(kv[0])))
+        if isinstance(value, (list, tuple)):
+            return type(value), tuple(freeze(v) for v in value)
+        return value
+
+    frozen = freeze(options)
+    try:
+        hash(frozen)
+    except TypeError:
+        return None
+    return frozen
+
+
+def _create_plot_df(series: pd.DataFrame, alpha: float = 0.05,
+                    backend: str = "altair") -> pd.DataFrame:
     """Creates a dataframe for plotting impact inferences.
 
     This function generates data for visualizing impact inferences by plotting observed and predicted values with uncertainty bands, and faceting by scale.
@@ -535,9 +916,12 @@ def _create_plot_df(series: pd.DataFrame, alpha: float = 0.05) -> pd.DataFrame:
     Args:
         series (pd.DataFrame): Output from sts_mod.evaluate(), containing observed and predicted outcomes, as well as absolute and cumulative impact estimates.
         alpha (float): Confidence level for standard deviation-based uncertainty intervals.
+        backend (str): Plotting backend the frame is for. The altair-only label
+            columns (`zero`, `scale_pretty`, `stat_pretty`) are only added for "altair".
 
     Returns:
-        DataFrame indexed by time for plotting.
+        DataFrame for plotting, with the rows of each scale contiguous and
+        ordered original, pointwise, cumulative.
         Columns:
             value (float): Values to plot as lines.
             upper (float): Upper uncertainty bounds.
@@ -547,7 +931,12 @@ def _create_plot_df(series: pd.DataFrame, alpha: float = 0.05) -> pd.DataFrame:
             scale_prett (str): Formatted scale label for plots.
             stat_pretty (str): Formatted statistic label for plots.
             zero (float): Reference line for absolute and cumulative effect plots.
+
+        The last three columns are only present when `backend` is "altair".
     """
+    # Add the time column to a shallow copy so the caller's frame is left
+    # untouched; the existing columns are shared rather than copied.
+    series = series.copy(deep=False)
     series["time"] = series.index
 
     # Create dataframes for each component of the plot (lines and uncertainty
@@ -556,7 +945,14 @@ def _create_plot_df(series: pd.DataFrame, alpha: float = 0.05) -> pd.DataFrame:
     bands_df = _create_plot_component_df(series, "bands")
     if any(["std" in col for col in series.columns]):
         std_df = _create_plot_component_df(series, "std", alpha)
-        bands_df = pd.concat([bands_df, std_df], axis=0, sort=True)
+        # Both components share the same columns, so align them explicitly
+        # instead of having concat sort the column union.
+        band_columns = [
+            "time", "scale", "lower", "upper", "band_method", "pre_period_start",
+            "pre_period_end", "post_period_start", "post_period_end"
+        ]
+        bands_df = pd.concat([bands_df[band_columns], std_df[band_columns]],
+                             axis=0, sort=False, ignore_index=True)
 
     # Merge the component dataframes. Use left join because lines_df will contain
     # observed data outside of the pre/post period intervals, whereas bands_df
@@ -569,6 +965,11 @@ def _create_plot_df(series: pd.DataFrame, alpha: float = 0.05) -> pd.DataFrame:
         ],
         how="left")
 
+    # The matplotlib figure draws its own zero lines and labels, so it needs
+    # none of the columns below.
+    if backend != "altair":
+        return plot_df
+
     # Add a zero column so we can plot a zero line for the absolute and
     # cumulative scales, but set it to np.nan for the original scale so it
     # doesn't get plotted.
@@ -576,13 +977,14 @@ def _create_plot_df(series: pd.DataFrame, alpha: float = 0.05) -> pd.DataFrame:
     plot_df.loc[plot_df["scale"] == "original", "zero"] = np.nan
 
     # Make nicer versions of the scale and stat variables for use as plot labels.
-    plot_df["scale_pretty"] = [
-        "Original" if m == "original" else
-        "Pointwise" if m == "point_effects" else "Cumulative"
-        for m in plot_df["scale"]
-    ]
-    plot_df["scale_pretty"] = pd.Categorical(
-        plot_df["scale_pretty"],
+    # Codes index into the categories below; anything that is neither the
+    # original nor the pointwise scale is cumulative.
+    scale_arr = plot_df["scale"].to_numpy()
+    scale_codes = np.full(len(scale_arr), 2, dtype=np.int8)
+    scale_codes[scale_arr == "original"] = 0
+    scale_codes[scale_arr == "point_effects"] = 1
+    plot_df["scale_pretty"] = pd.Categorical.from_codes(
+        scale_codes,
         categories=["Original", "Pointwise", "Cumulative"],
         ordered=True)
     plot_df["stat_pretty"] = plot_df["stat"].str.capitalize()
@@ -594,8 +996,43 @@ def _create_plot_df(series: pd.DataFrame, alpha: float = 0.05) -> pd.DataFrame:
     return plot_df
 
 
-import pandas as pd
-import tensorflow_probability as tfp
+@functools.lru_cache(maxsize=16)
+def _normal_quantile(q: float) -> float:
+    """Returns the `q` quantile of the standard normal distribution."""
+    return statistics.NormalDist().inv_cdf(q)
+
+
+def _std_bounds(mean: np.ndarray, std: np.ndarray, z_score: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns `mean -/+ z_score * std` as (lower, upper) arrays."""
+    # Scale the std once and reuse that buffer for the upper bound.
+    half_width = np.multiply(std, z_score)
+    lower = np.subtract(mean, half_width)
+    upper = np.add(mean, half_width, out=half_width)
+    return lower, upper
+
+
+_STATISTICAL_SUFFIXES = re.compile("_upper|_lower|_mean|_median|_std")
+_ORIGINAL_SCALE_KEYWORDS = re.compile("observed|posterior")
+_SCALE_PREFIXES = re.compile("posterior_|point_effects_|cumulative_effects_")
+
+
+# Position of each scale in the plots; any other scale is cumulative.
+_SCALE_ORDER = {"original": 0, "point_effects": 1}
+
+
+def _split_scale_stat(scale_stat: str) -> Tuple[str, str]:
+    """Splits a column name such as 'point_effects_lower' into (scale, stat).
+
+    Observed and posterior columns are assigned the 'original' scale.
+    """
+    # Extract 'scale' by removing statistical suffixes
+    scale = _STATISTICAL_SUFFIXES.sub("", scale_stat)
+    # Assign 'original' scale to observed or posterior statistics
+    if _ORIGINAL_SCALE_KEYWORDS.search(scale):
+        scale = "original"
+    # Extract 'stat' by removing scale prefixes
+    stat = _SCALE_PREFIXES.sub("", scale_stat)
+    return scale, stat
 
 
 def _create_plot_component_df(series: pd.DataFrame,
@@ -650,57 +1087,183 @@ def _create_plot_component_df(series: pd.DataFrame,
 
     # Extract relevant columns from the series
     extracted_columns = [col for col in series.columns if any(stub in col for stub in required_columns)]
-    filtered_df = series[extracted_columns]
 
-    # Melt the dataframe to long format for easier manipulation
-    melted_df = filtered_df.melt(
-        id_vars=base_columns,
-        var_name="scale_stat",
-        value_name="value"
-    )
+    if component == "lines":
+        return _create_lines_df(series[extracted_columns], base_columns)
+
+    # For 'bands' and 'std' every scale contributes one pair of stat columns
+    # that maps directly onto the wide output, so there is no need to melt to
+    # long format and pivot back. Build one thin frame per scale and stack them.
+    stat_names = ["lower", "upper"] if component == "bands" else ["mean", "std"]
+    columns_by_scale = {}
+    for col in extracted_columns:
+        if col in base_columns:
+            continue
+        scale, stat = _split_scale_stat(col)
+        if stat in stat_names:
+            columns_by_scale.setdefault(scale, {})[col] = stat
+
+    scale_frames = []
+    for scale, stat_columns in columns_by_scale.items():
+        scale_df = series[base_columns + list(stat_columns)].rename(columns=stat_columns)
+        scale_df = scale_df.reindex(columns=base_columns + stat_names)
+        # Time points without any band values (e.g. outside the pre/post
+        # periods) are left out; they are filled back in as NaN by the merge
+        # in `_create_plot_df`.
+        scale_df = scale_df.dropna(how="all", subset=stat_names)
+        scale_df.insert(1, "scale", scale)
+        scale_frames.append(scale_df)
+    if scale_frames:
+        wide_df = pd.concat(scale_frames, axis=0, ignore_index=True)
+    else:
+        wide_df = pd.DataFrame(columns=base_columns[:1] + ["scale"] + base_columns[1:] + stat_names)
 
-    # Extract 'scale' by removing statistical suffixes
-    statistical_suffixes = "_upper|_lower|_mean|_median|_std"
-    melted_df["scale"] = melted_df["scale_stat"].str.replace(statistical_suffixes, "", regex=True)
+    # Assign the band calculation method based on the component
+    wide_df["band_method"] = "quantile" if component == "bands" else "std"
 
-    # Assign 'original' scale to observed or posterior statistics
-    original_scale_keywords = "observed|posterior"
-    melted_df.loc[melted_df["scale"].str.contains(original_scale_keywords, regex=True), "scale"] = "original"
+    # For 'std' component, calculate the confidence intervals using the standard deviation
+    if component == "std":
+        z_score = _normal_quantile(1 - alpha / 2)
+        lower, upper = _std_bounds(wide_df["mean"].to_numpy(dtype=float),
+                                   wide_df["std"].to_numpy(dtype=float),
+                                   z_score)
+        wide_df[["lower", "upper"]] = np.column_stack([lower, upper])
+        wide_df.drop(columns=["mean", "std"], inplace=True)
 
-    # Extract 'stat' by removing scale prefixes
-    scale_prefixes = "posterior_|point_effects_|cumulative_effects_"
-    melted_df["stat"] = melted_df["scale_stat"].str.replace(scale_prefixes, "", regex=True)
+    return wide_df
 
-    # Drop the intermediate 'scale_stat' column
-    melted_df.drop(columns=["scale_stat"], inplace=True)
 
-    # Reshape for 'bands' and 'std' components to have separate 'upper' and 'lower' columns
-    if component in {"bands", "std"}:
-        pivot_columns = [
-            "time", "scale", "pre_period_start", "pre_period_end",
-            "post_period_start", "post_period_end"
-        ]
-        pivoted_df = melted_df.pivot_table(
-            index=pivot_columns,
-            columns="stat",
-            values="value"
-        ).reset_index()
-
-        # Assign the band calculation method based on the component
-        pivoted_df["band_method"] = "quantiles" if component == "bands" else "std"
-
-        # For 'std' component, calculate the confidence intervals using the standard deviation
-        if component == "std":
-            z_score = tfp.distributions.Normal(0, 1).quantile(1 - alpha / 2).numpy()
-            pivoted_df["lower"] = pivoted_df["mean"] - z_score * pivoted_df["std"]
-            pivoted_df["upper"] = pivoted_df["mean"] + z_score * pivoted_df["std"]
-            pivoted_df.drop(columns=["mean", "std"], inplace=True)
-
-        filtered_df = pivoted_df
-    else:
-        filtered_df = melted_df
+def _create_lines_df(filtered_df: pd.DataFrame, base_columns) -> pd.DataFrame:
+    """Converts the line columns of the series to long format.
+
+    Args:
+        filtered_df (pd.DataFrame): Series restricted to `base_columns` plus the
+            observed, mean and median columns.
+        base_columns (list): Columns kept as identifiers in the long format.
+
+    Returns:
+        pd.DataFrame: Long-form dataframe with `value`, `scale` and `stat` columns.
+    """
+    # Stack the value columns directly into long format: the id columns are
+    # repeated once per value column and each column name is split into its
+    # scale and stat once, rather than once per row. The columns are stacked
+    # in scale order, so the rows of each scale are contiguous and the original
+    # scale comes first.
+    value_columns = [col for col in filtered_df.columns if col not in base_columns]
+    value_columns.sort(key=lambda col: _SCALE_ORDER.get(_split_scale_stat(col)[0], 2))
+    n_rows = len(filtered_df)
+    scales, stats = zip(*(_split_scale_stat(col) for col in value_columns))
+
+    melted_df = filtered_df[base_columns].take(np.tile(np.arange(n_rows), len(value_columns)))
+    melted_df.reset_index(drop=True, inplace=True)
+    melted_df["value"] = np.concatenate([filtered_df[col].to_numpy() for col in value_columns])
+    melted_df["scale"] = np.repeat(np.array(scales, dtype=object), n_rows)
+    melted_df["stat"] = np.repeat(np.array(stats, dtype=object), n_rows)
+
+    return melted_df
+
+
+# Columns of the plot data that the altair specs reference; only these are
+# embedded in the chart.
+_ALTAIR_COLUMNS = [
+    "time", "value", "lower", "upper", "zero", "scale_pretty", "stat_pretty",
+    "pre_period_start", "pre_period_end", "post_period_start", "post_period_end"
+]
+
+
+def _altair_data(plot_df: pd.DataFrame, vegafusion: bool = False) -> pd.DataFrame:
+    """
+    Restricts the plot data to `_ALTAIR_COLUMNS` before altair serializes it.
+
+    Charts built for VegaFusion ship their data as Arrow, so the float columns
+    are also halved to float32. The default JSON transport is left at float64:
+    float32 values print with more digits there.
+    """
+    plot_df = plot_df[_ALTAIR_COLUMNS]
+    if vegafusion:
+        plot_df = plot_df.astype(
+            {col: np.float32 for col in plot_df.select_dtypes(np.float64).columns})
+    return plot_df
+
+
+def _font_sizes(kwargs: Dict[str, Any]) -> Tuple[int, int, int]:
+    """Returns the axis title, axis label and facet label font sizes of `kwargs`."""
+    return (kwargs.get("axis_title_font_size", 18),
+            kwargs.get("axis_label_font_size", 16),
+            kwargs.get("strip_title_font_size", 20))
+
+
+@functools.lru_cache(maxsize=1)
+def _row_spec() -> "alt.Row":
+    """Returns the facet row spec shared by the altair plots."""
+    import altair as alt
+
+    return alt.Row(
+        "scale_pretty:N", sort=["Original", "Pointwise", "Cumulative"], title="")
+
+
+@functools.lru_cache(maxsize=8)
+def _color_spec(label_font_size: int) -> "alt.Color":
+    """Returns the color spec of the line layers, with a legend of the stats."""
+    import altair as alt
+
+    return alt.Color(
+        "stat_pretty:N",
+        legend=alt.Legend(
+            title="",
+            labelFontSize=label_font_size,
+            symbolSize=10 * label_font_size))
+
+
+class _VegaChart:
+    """An altair chart compiled to Vega, displayed without recompiling it."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+
+    def to_dict(self, *args, **kwargs) -> Dict[str, Any]:
+        """Returns the Vega spec; altair's `to_dict` arguments are accepted and ignored."""
+        return self.spec
+
+    def _repr_mimebundle_(self, include=None, exclude=None):
+        return {"application/vnd.vega.v5+json": self.spec}
+
+
+def _vegafusion_enabled(enabled: bool):
+    """Returns a context in which altair uses the VegaFusion data transformer if `enabled`."""
+    if not enabled:
+        return contextlib.nullcontext()
+    import altair as alt
 
-    return filtered_df
+    return alt.data_transformers.enable("vegafusion")
+
+
+def _visible_vlines(plot_df: pd.DataFrame) -> list:
+    """
+    Returns the period boundary columns to draw as vertical rules.
+
+    The start of the post-period is always drawn; the other boundaries are only
+    drawn when there is data before, between or after the periods.
+    """
+    # Extract period boundaries from the first row
+    periods = {
+        "pre_period_start": plot_df.at[0, "pre_period_start"],
+        "pre_period_end": plot_df.at[0, "pre_period_end"],
+        "post_period_start": plot_df.at[0, "post_period_start"],
+        "post_period_end": plot_df.at[0, "post_period_end"],
+    }
+    # Data before or after the periods shows up in the extremes of the time
+    # column, so those checks compare scalars. Only the gap between the periods
+    # needs a scan.
+    t_min, t_max = plot_df["time"].agg(["min", "max"])
+    visible = {
+        "pre_period_start": t_min < periods["pre_period_start"],
+        "pre_period_end": ((plot_df["time"] > periods["pre_period_end"]) &
+                           (plot_df["time"] < periods["post_period_start"])).any(),
+        "post_period_start": True,
+        "post_period_end": t_max > periods["post_period_end"],
+    }
+    return [key for key, is_visible in visible.items() if is_visible]
 
 
 def _create_base_layers(plot_df: pd.DataFrame, **kwargs) -> dict:
@@ -713,6 +1276,9 @@ def _create_base_layers(plot_df: pd.DataFrame, **kwargs) -> dict:
     - Horizontal reference line at zero.
     - Vertical reference lines indicating the start and end of pre- and post-treatment periods.
 
+    The layers carry no data of their own; `plot_df` is attached once to the
+    chart they are layered into, so the chart holds a single dataset.
+
     Args:
         plot_df (pd.DataFrame): Dataframe containing the data to plot, including time indices and period boundaries.
         **kwargs: Optional plot parameters.
@@ -749,16 +1315,30 @@ def _create_base_layers(plot_df: pd.DataFrame, **kwargs) -> dict:
     if missing_columns:
         raise KeyError(f"The following required columns are missing in plot_df: {missing_columns}")
 
-    # Extract period boundaries from the first row
-    periods = {
-        "pre_period_start": plot_df.at[0, "pre_period_start"],
-        "pre_period_end": plot_df.at[0, "pre_period_end"],
-        "post_period_start": plot_df.at[0, "post_period_start"],
-        "post_period_end": plot_df.at[0, "post_period_end"],
+    # The layers carry no data, so they only depend on the chart size and on
+    # which period rules are drawn and can be shared between calls. Callers
+    # derive new charts with `.encode()` and friends, which copy the chart.
+    lines, band, hline, vlines = _base_layer_charts(
+        chart_width, chart_height, tuple(_visible_vlines(plot_df)))
+
+    # Compile all base layers into a dictionary
+    base_layers = {
+        "lines": lines,
+        "band": band,
+        "hline": hline,
+        "vlines": dict(vlines)
     }
 
+    return base_layers
+
+
+@functools.lru_cache(maxsize=8)
+def _base_layer_charts(chart_width: int, chart_height: int, vline_keys: Tuple[str, ...]) -> tuple:
+    """Builds the `_create_base_layers` charts; `vlines` is a tuple of (key, chart) pairs."""
+    import altair as alt
+
     # Create the base line layer for the data values
-    base_lines = alt.Chart(plot_df).mark_line().encode(
+    base_lines = alt.Chart().mark_line().encode(
         x=alt.X("time:T", title="Time"),
         y=alt.Y("value:Q", scale=alt.Scale(zero=False), title="")
     ).properties(
@@ -767,7 +1347,7 @@ def _create_base_layers(plot_df: pd.DataFrame, **kwargs) -> dict:
     )
 
     # Create the uncertainty band layer
-    uncertainty_band = alt.Chart(plot_df).mark_area(opacity=0.3).encode(
+    uncertainty_band = alt.Chart().mark_area(opacity=0.3).encode(
         x=alt.X("time:T", title="Time"),
         y="upper:Q",
         y2="lower:Q"
@@ -777,57 +1357,25 @@ def _create_base_layers(plot_df: pd.DataFrame, **kwargs) -> dict:
     )
 
     # Create a horizontal reference line at zero
-    horizontal_zero = alt.Chart(plot_df).mark_rule(color="red").encode(
+    horizontal_zero = alt.Chart().mark_rule(color="red").encode(
         y=alt.Y("zero:Q")
     )
 
-    # Initialize dictionary to hold vertical reference lines
-    vertical_lines = {}
-
-    # Define helper function to add a vertical line if condition is met
-    def add_vline(key, condition, x_value):
-        if condition:
-            vertical_lines[key] = alt.Chart(plot_df).mark_rule(
-                strokeDash=[5, 5],
-                color="grey"
-            ).encode(
-                x=alt.X(x_value + ":T")
-            )
-
     # Add vertical lines based on period boundaries
-    add_vline(
-        "pre_period_start",
-        (plot_df["time"] < periods["pre_period_start"]).any(),
-        "pre_period_start"
-    )
-    add_vline(
-        "pre_period_end",
-        ((plot_df["time"] > periods["pre_period_end"]) & (plot_df["time"] < periods["post_period_start"])).any(),
-        "pre_period_end"
-    )
-    add_vline(
-        "post_period_start",
-        True,  # Always draw the start of the post-period
-        "post_period_start"
-    )
-    add_vline(
-        "post_period_end",
-        (plot_df["time"] > periods["post_period_end"]).any(),
-        "post_period_end"
+    vertical_lines = tuple(
+        (key, alt.Chart().mark_rule(
+            strokeDash=[5, 5],
+            color="grey"
+        ).encode(
+            x=alt.X(key + ":T")
+        ))
+        for key in vline_keys
     )
 
-    # Compile all base layers into a dictionary
-    base_layers = {
-        "lines": base_lines,
-        "band": uncertainty_band,
-        "hline": horizontal_zero,
-        "vlines": vertical_lines
-    }
+    return base_lines, uncertainty_band, horizontal_zero, vertical_lines
 
-    return base_layers
 
-
-def _draw_classic_plot(plot_df: pd.DataFrame, **kwargs) -> alt.Chart:
+def _draw_classic_plot(plot_df: pd.DataFrame, **kwargs) -> "alt.Chart":
     """Draw the classic static impact plot as in the R package.
 
     Args:
@@ -842,38 +1390,35 @@ def _draw_classic_plot(plot_df: pd.DataFrame, **kwargs) -> alt.Chart:
     Returns:
       alt.Chart object.
     """
+    import altair as alt
+
+    plot_df = _altair_data(plot_df, kwargs.get("vegafusion", False))
+    axis_title_font_size, axis_label_font_size, strip_title_font_size = _font_sizes(kwargs)
+
     layers = _create_base_layers(plot_df, **kwargs)
 
     # Add color spec to lines.
-    color_spec = alt.Color(
-        "stat_pretty:N",
-        legend=alt.Legend(
-            title="",
-            labelFontSize=kwargs["axis_label_font_size"],
-            symbolSize=10 * kwargs["axis_label_font_size"]))
-    layers["lines"] = layers["lines"].encode(color=color_spec)
-
-    # Unpack the vertical rule chart objects into a list; combine with the other
-    # chart layers into a tuple that can be passed to alt.layer() to create the
-    # final plot.
-    vlines = list(layers["vlines"].values())
-    chart_layers = tuple([layers["lines"], layers["band"], layers["hline"]] +
-                         vlines)
+    layers["lines"] = layers["lines"].encode(color=_color_spec(axis_label_font_size))
+
+    # Combine the vertical rule chart objects with the other chart layers into
+    # a tuple that can be passed to alt.layer() to create the final plot. The
+    # chart is built through the altair API on purpose: loading the same spec
+    # with `alt.FacetChart.from_dict` converts every nested dict back into
+    # schema objects and takes about twice as long.
+    chart_layers = (layers["lines"], layers["band"], layers["hline"],
+                    *layers["vlines"].values())
     final_plot = alt.layer(
         *chart_layers, data=plot_df).facet(
-        row=alt.Row(
-            "scale_pretty:N",
-            sort=["Original", "Pointwise", "Cumulative"],
-            title="")).resolve_scale(y="independent").configure(
+        row=_row_spec()).resolve_scale(y="independent").configure(
         background="white").configure_axis(
-        titleFontSize=kwargs["axis_title_font_size"],
-        labelFontSize=kwargs["axis_label_font_size"]
+        titleFontSize=axis_title_font_size,
+        labelFontSize=axis_label_font_size
     ).configure_header(
-        labelFontSize=kwargs["strip_title_font_size"])
+        labelFontSize=strip_title_font_size)
     return final_plot
 
 
-def _draw_interactive_plot(plot_df: pd.DataFrame, **kwargs) -> alt.Chart:
+def _draw_interactive_plot(plot_df: pd.DataFrame, **kwargs) -> "alt.Chart":
     """Draw interactive impact plot.
 
     Args:
@@ -887,6 +1432,9 @@ def _draw_interactive_plot(plot_df: pd.DataFrame, **kwargs) -> alt.Chart:
     Returns:
       altair Chart object.
     """
+    import altair as alt
+
+    axis_title_font_size, axis_label_font_size, strip_title_font_size = _font_sizes(kwargs)
 
     # ############################################################################
     # Create interactive selection elements.
@@ -900,7 +1448,8 @@ def _draw_interactive_plot(plot_df: pd.DataFrame, **kwargs) -> alt.Chart:
     selection_color = alt.condition(stat_selection,
                                     alt.Color("stat_pretty:N", legend=None),
                                     alt.value("lightgray"))
-    legend = alt.Chart(plot_df).mark_point().encode(
+    # The legend only needs the distinct stats, not the whole plot data.
+    legend = alt.Chart(plot_df[["stat_pretty"]].drop_duplicates()).mark_point().encode(
         y=alt.Y("stat_pretty:N", axis=alt.Axis(orient="right"), title=""),
         color=selection_color).add_selection(stat_selection)
 
@@ -908,35 +1457,30 @@ def _draw_interactive_plot(plot_df: pd.DataFrame, **kwargs) -> alt.Chart:
     # Create the static top chart.
     # ############################################################################
 
-    # The static chart is for the data on the original scale.
-    static_df = plot_df.loc[plot_df["scale"] == "original"]
+    # The static chart is for the data on the original scale. Rows are grouped
+    # by scale with the original scale first (see `_create_lines_df`), so it is
+    # a prefix of the frame that a binary search over the scale codes finds.
+    num_original = plot_df["scale_pretty"].cat.codes.searchsorted(1)
+    vegafusion = kwargs.get("vegafusion", False)
+    static_df = _altair_data(plot_df.iloc[:num_original], vegafusion)
+    plot_df = _altair_data(plot_df, vegafusion)
 
     # Create static layers and add the color spec to the lines layer and the
     # brush selection to the bands layer.
     static_layers = _create_base_layers(static_df, **kwargs)
-    static_color_spec = alt.Color(
-        "stat_pretty:N",
-        legend=alt.Legend(
-            title="",
-            labelFontSize=kwargs["axis_label_font_size"],
-            symbolSize=10 * kwargs["axis_label_font_size"]))
     static_layers["lines"] = static_layers["lines"].encode(
-        color=static_color_spec)
+        color=_color_spec(axis_label_font_size))
     static_layers["band"] = static_layers["band"].add_selection(brush)
 
     # Combine layers of static top chart. Add the brush selection to the band
     # layer to enable selecting a date range on the x-axis for the bottom plots to
     # zoom in on (you only need to put it on one layer, so it could also have been
     # added to the lines layer).
-    row_spec = alt.Row(
-        "scale_pretty:N", sort=["Original", "Pointwise", "Cumulative"], title="")
-    # Unpack the vertical rule chart objects into a list; combine with the other
-    # chart layers into a tuple that can be passed to alt.layer to create the
-    # full static plot.
-    static_vlines = list(static_layers["vlines"].values())
-    top_chart_layers = tuple(
-        [static_layers["lines"], static_layers["band"], static_layers["hline"]] +
-        static_vlines)
+    row_spec = _row_spec()
+    # Combine the vertical rule chart objects with the other chart layers into
+    # a tuple that can be passed to alt.layer to create the full static plot.
+    top_chart_layers = (static_layers["lines"], static_layers["band"],
+                        static_layers["hline"], *static_layers["vlines"].values())
     top_static_plot = alt.layer(
         *top_chart_layers,
         data=static_df).facet(row=row_spec).resolve_scale(y="independent")
@@ -948,23 +1492,21 @@ def _draw_interactive_plot(plot_df: pd.DataFrame, **kwargs) -> alt.Chart:
 
     # Create dynamic layers and add interactive selections.
     dynamic_layers = _create_base_layers(plot_df, **kwargs)
+    brush_scale = alt.Scale(domain=brush)
+    brush_x = alt.X("time", scale=brush_scale, title="Time")
     dynamic_layers["lines"] = dynamic_layers["lines"].encode(
-        color=selection_color,
-        x=alt.X("time", scale=alt.Scale(domain=brush), title="Time"))
-    dynamic_layers["band"] = dynamic_layers["band"].encode(
-        x=alt.X("time", scale=alt.Scale(domain=brush), title="Time"))
+        color=selection_color, x=brush_x)
+    dynamic_layers["band"] = dynamic_layers["band"].encode(x=brush_x)
 
     # Add interactive selections to each of the vertical line chart objects.
     for vline_date, vline_object in dynamic_layers["vlines"].items():
         dynamic_layers["vlines"][vline_date] = vline_object.encode(
-            x=alt.X(vline_date, scale=alt.Scale(domain=brush)))
+            x=alt.X(vline_date, scale=brush_scale))
 
     # Combine the dynamic chart layers into a tuple that can be used with
     # alt.layer() to create the full dynamic plot.
-    dynamic_vlines = list(dynamic_layers["vlines"].values())
-    bottom_chart_layers = tuple([
-                                    dynamic_layers["lines"], dynamic_layers["band"], dynamic_layers["hline"]
-                                ] + dynamic_vlines)
+    bottom_chart_layers = (dynamic_layers["lines"], dynamic_layers["band"],
+                           dynamic_layers["hline"], *dynamic_layers["vlines"].values())
     bottom_dynamic_plot = alt.layer(
         *bottom_chart_layers,
         data=plot_df).facet(row=row_spec).resolve_scale(y="independent")
@@ -977,6 +1519,6 @@ def _draw_interactive_plot(plot_df: pd.DataFrame, **kwargs) -> alt.Chart:
     # horizontally concatenate with little interactive legend chart.
     final_chart = alt.vconcat(top_static_plot, bottom_dynamic_plot)
     return (final_chart | legend).configure(background="white").configure_axis(
-        titleFontSize=kwargs["axis_title_font_size"],
-        labelFontSize=kwargs["axis_label_font_size"]).configure_header(
-        labelFontSize=kwargs["strip_title_font_size"])
+        titleFontSize=axis_title_font_size,
+        labelFontSize=axis_label_font_size).configure_header(
+        labelFontSize=strip_title_font_size)
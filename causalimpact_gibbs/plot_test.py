@@ -15,11 +15,23 @@
 
 """Tests for plot.py."""
 
+import json
+import re
+
 from absl.testing import absltest
 from absl.testing import parameterized
 
 import causalimpact_gibbs as ci
+from causalimpact_gibbs.plot import _altair_data
+from causalimpact_gibbs.plot import _build_fig
 from causalimpact_gibbs.plot import _create_plot_component_df
+from causalimpact_gibbs.plot import _create_plot_df
+from causalimpact_gibbs.plot import _create_y_axis_formatter
+from causalimpact_gibbs.plot import _draw_classic_plot
+from causalimpact_gibbs.plot import _PlotOpts
+from causalimpact_gibbs.plot import _update_fig
+from causalimpact_gibbs.plot import _VegaChart
+from matplotlib.collections import PolyCollection
 import numpy as np
 import pandas as pd
 
@@ -27,41 +39,41 @@ import pandas as pd
 expected_classic_dict_four_vlines = {
     "facet": {
         "row": {
-            "type": "nominal",
             "field": "scale_pretty",
             "sort": ["Original", "Pointwise", "Cumulative"],
-            "title": ""
+            "title": "",
+            "type": "nominal"
         }
     },
     "spec": {
         "layer": [{
-            "mark": "line",
+            "mark": {
+                "type": "line"
+            },
             "encoding": {
                 "color": {
-                    "type": "nominal",
                     "field": "stat_pretty",
                     "legend": {
                         "labelFontSize": 16,
                         "symbolSize": 160,
                         "title": ""
-                    }
+                    },
+                    "type": "nominal"
                 },
                 "x": {
-                    "type": "temporal",
                     "field": "time",
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
                     "field": "value",
                     "scale": {
                         "zero": False
                     },
-                    "title": ""
+                    "title": "",
+                    "type": "quantitative"
                 }
-            },
-            "height": 200,
-            "width": 600
+            }
         }, {
             "mark": {
                 "type": "area",
@@ -69,85 +81,80 @@ expected_classic_dict_four_vlines = {
             },
             "encoding": {
                 "x": {
-                    "type": "temporal",
                     "field": "time",
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
-                    "field": "upper"
+                    "field": "upper",
+                    "type": "quantitative"
                 },
                 "y2": {
                     "field": "lower"
                 }
-            },
-            "height": 200,
-            "width": 600
+            }
         }, {
-            "mark": "rule",
+            "mark": {
+                "type": "rule",
+                "color": "red"
+            },
             "encoding": {
                 "y": {
-                    "type": "quantitative",
-                    "field": "zero"
+                    "field": "zero",
+                    "type": "quantitative"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "temporal",
-                    "field": "pre_period_start"
+                    "field": "pre_period_start",
+                    "type": "temporal"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "temporal",
-                    "field": "pre_period_end"
+                    "field": "pre_period_end",
+                    "type": "temporal"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "temporal",
-                    "field": "post_period_start"
+                    "field": "post_period_start",
+                    "type": "temporal"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "temporal",
-                    "field": "post_period_end"
+                    "field": "post_period_end",
+                    "type": "temporal"
                 }
             }
-        }]
+        }],
+        "height": 200,
+        "width": 600
     },
     "resolve": {
         "scale": {
@@ -159,41 +166,41 @@ expected_classic_dict_four_vlines = {
 expected_classic_dict_two_vlines = {
     "facet": {
         "row": {
-            "type": "nominal",
             "field": "scale_pretty",
             "sort": ["Original", "Pointwise", "Cumulative"],
-            "title": ""
+            "title": "",
+            "type": "nominal"
         }
     },
     "spec": {
         "layer": [{
-            "mark": "line",
+            "mark": {
+                "type": "line"
+            },
             "encoding": {
                 "color": {
-                    "type": "nominal",
                     "field": "stat_pretty",
                     "legend": {
                         "labelFontSize": 16,
                         "symbolSize": 160,
                         "title": ""
-                    }
+                    },
+                    "type": "nominal"
                 },
                 "x": {
-                    "type": "temporal",
                     "field": "time",
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
                     "field": "value",
                     "scale": {
                         "zero": False
                     },
-                    "title": ""
+                    "title": "",
+                    "type": "quantitative"
                 }
-            },
-            "height": 200,
-            "width": 600
+            }
         }, {
             "mark": {
                 "type": "area",
@@ -201,57 +208,56 @@ expected_classic_dict_two_vlines = {
             },
             "encoding": {
                 "x": {
-                    "type": "temporal",
                     "field": "time",
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
-                    "field": "upper"
+                    "field": "upper",
+                    "type": "quantitative"
                 },
                 "y2": {
                     "field": "lower"
                 }
-            },
-            "height": 200,
-            "width": 600
+            }
         }, {
-            "mark": "rule",
+            "mark": {
+                "type": "rule",
+                "color": "red"
+            },
             "encoding": {
                 "y": {
-                    "type": "quantitative",
-                    "field": "zero"
+                    "field": "zero",
+                    "type": "quantitative"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "temporal",
-                    "field": "pre_period_end"
+                    "field": "pre_period_end",
+                    "type": "temporal"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "temporal",
-                    "field": "post_period_start"
+                    "field": "post_period_start",
+                    "type": "temporal"
                 }
             }
-        }]
+        }],
+        "height": 200,
+        "width": 600
     },
     "resolve": {
         "scale": {
@@ -263,41 +269,41 @@ expected_classic_dict_two_vlines = {
 expected_classic_dict_one_vline = {
     "facet": {
         "row": {
-            "type": "nominal",
             "field": "scale_pretty",
             "sort": ["Original", "Pointwise", "Cumulative"],
-            "title": ""
+            "title": "",
+            "type": "nominal"
         }
     },
     "spec": {
         "layer": [{
-            "mark": "line",
+            "mark": {
+                "type": "line"
+            },
             "encoding": {
                 "color": {
-                    "type": "nominal",
                     "field": "stat_pretty",
                     "legend": {
                         "labelFontSize": 16,
                         "symbolSize": 160,
                         "title": ""
-                    }
+                    },
+                    "type": "nominal"
                 },
                 "x": {
-                    "type": "temporal",
                     "field": "time",
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
                     "field": "value",
                     "scale": {
                         "zero": False
                     },
-                    "title": ""
+                    "title": "",
+                    "type": "quantitative"
                 }
-            },
-            "height": 200,
-            "width": 600
+            }
         }, {
             "mark": {
                 "type": "area",
@@ -305,43 +311,44 @@ expected_classic_dict_one_vline = {
             },
             "encoding": {
                 "x": {
-                    "type": "temporal",
                     "field": "time",
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
-                    "field": "upper"
+                    "field": "upper",
+                    "type": "quantitative"
                 },
                 "y2": {
                     "field": "lower"
                 }
-            },
-            "height": 200,
-            "width": 600
+            }
         }, {
-            "mark": "rule",
+            "mark": {
+                "type": "rule",
+                "color": "red"
+            },
             "encoding": {
                 "y": {
-                    "type": "quantitative",
-                    "field": "zero"
+                    "field": "zero",
+                    "type": "quantitative"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "temporal",
-                    "field": "post_period_start"
+                    "field": "post_period_start",
+                    "type": "temporal"
                 }
             }
-        }]
+        }],
+        "height": 200,
+        "width": 600
     },
     "resolve": {
         "scale": {
@@ -353,41 +360,41 @@ expected_classic_dict_one_vline = {
 expected_classic_dict_one_vline_integer_index = {
     "facet": {
         "row": {
-            "type": "nominal",
             "field": "scale_pretty",
             "sort": ["Original", "Pointwise", "Cumulative"],
-            "title": ""
+            "title": "",
+            "type": "nominal"
         }
     },
     "spec": {
         "layer": [{
-            "mark": "line",
+            "mark": {
+                "type": "line"
+            },
             "encoding": {
                 "color": {
-                    "type": "nominal",
                     "field": "stat_pretty",
                     "legend": {
                         "labelFontSize": 16,
                         "symbolSize": 160,
                         "title": ""
-                    }
+                    },
+                    "type": "nominal"
                 },
                 "x": {
-                    "type": "quantitative",
                     "field": "time",
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
                     "field": "value",
                     "scale": {
                         "zero": False
                     },
-                    "title": ""
+                    "title": "",
+                    "type": "quantitative"
                 }
-            },
-            "height": 200,
-            "width": 600
+            }
         }, {
             "mark": {
                 "type": "area",
@@ -395,43 +402,44 @@ expected_classic_dict_one_vline_integer_index = {
             },
             "encoding": {
                 "x": {
-                    "type": "quantitative",
                     "field": "time",
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
-                    "field": "upper"
+                    "field": "upper",
+                    "type": "quantitative"
                 },
                 "y2": {
                     "field": "lower"
                 }
-            },
-            "height": 200,
-            "width": 600
+            }
         }, {
-            "mark": "rule",
+            "mark": {
+                "type": "rule",
+                "color": "red"
+            },
             "encoding": {
                 "y": {
-                    "type": "quantitative",
-                    "field": "zero"
+                    "field": "zero",
+                    "type": "quantitative"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "quantitative",
-                    "field": "post_period_start"
+                    "field": "post_period_start",
+                    "type": "temporal"
                 }
             }
-        }]
+        }],
+        "height": 200,
+        "width": 600
     },
     "resolve": {
         "scale": {
@@ -443,41 +451,41 @@ expected_classic_dict_one_vline_integer_index = {
 expected_top_dict = {
     "facet": {
         "row": {
-            "type": "nominal",
             "field": "scale_pretty",
             "sort": ["Original", "Pointwise", "Cumulative"],
-            "title": ""
+            "title": "",
+            "type": "nominal"
         }
     },
     "spec": {
         "layer": [{
-            "mark": "line",
+            "mark": {
+                "type": "line"
+            },
             "encoding": {
                 "color": {
-                    "type": "nominal",
                     "field": "stat_pretty",
                     "legend": {
                         "labelFontSize": 16,
                         "symbolSize": 160,
                         "title": ""
-                    }
+                    },
+                    "type": "nominal"
                 },
                 "x": {
-                    "type": "temporal",
                     "field": "time",
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
                     "field": "value",
                     "scale": {
                         "zero": False
                     },
-                    "title": ""
+                    "title": "",
+                    "type": "quantitative"
                 }
-            },
-            "height": 200,
-            "width": 600
+            }
         }, {
             "mark": {
                 "type": "area",
@@ -485,63 +493,57 @@ expected_top_dict = {
             },
             "encoding": {
                 "x": {
-                    "type": "temporal",
                     "field": "time",
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
-                    "field": "upper"
+                    "field": "upper",
+                    "type": "quantitative"
                 },
                 "y2": {
                     "field": "lower"
                 }
             },
-            "height": 200,
-            "selection": {
-                "selector001": {
-                    "type": "interval",
-                    "encodings": ["x"]
-                }
-            },
-            "width": 600
+            "name": "view_0"
         }, {
-            "mark": "rule",
+            "mark": {
+                "type": "rule",
+                "color": "red"
+            },
             "encoding": {
                 "y": {
-                    "type": "quantitative",
-                    "field": "zero"
+                    "field": "zero",
+                    "type": "quantitative"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "temporal",
-                    "field": "pre_period_end"
+                    "field": "pre_period_end",
+                    "type": "temporal"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "temporal",
-                    "field": "post_period_start"
+                    "field": "post_period_start",
+                    "type": "temporal"
                 }
             }
-        }]
+        }],
+        "height": 200,
+        "width": 600
     },
     "resolve": {
         "scale": {
@@ -553,46 +555,46 @@ expected_top_dict = {
 expected_bot_dict = {
     "facet": {
         "row": {
-            "type": "nominal",
             "field": "scale_pretty",
             "sort": ["Original", "Pointwise", "Cumulative"],
-            "title": ""
+            "title": "",
+            "type": "nominal"
         }
     },
     "spec": {
         "layer": [{
-            "mark": "line",
+            "mark": {
+                "type": "line"
+            },
             "encoding": {
                 "color": {
                     "condition": {
-                        "type": "nominal",
+                        "param": "param_1",
                         "field": "stat_pretty",
                         "legend": None,
-                        "selection": "selector002"
+                        "type": "nominal"
                     },
                     "value": "lightgray"
                 },
                 "x": {
-                    "type": "temporal",
                     "field": "time",
                     "scale": {
                         "domain": {
-                            "selection": "selector001"
+                            "param": "param_0"
                         }
                     },
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
                     "field": "value",
                     "scale": {
                         "zero": False
                     },
-                    "title": ""
+                    "title": "",
+                    "type": "quantitative"
                 }
-            },
-            "height": 200,
-            "width": 600
+            }
         }, {
             "mark": {
                 "type": "area",
@@ -600,72 +602,71 @@ expected_bot_dict = {
             },
             "encoding": {
                 "x": {
-                    "type": "temporal",
                     "field": "time",
                     "scale": {
                         "domain": {
-                            "selection": "selector001"
+                            "param": "param_0"
                         }
                     },
-                    "title": "Time"
+                    "title": "Time",
+                    "type": "temporal"
                 },
                 "y": {
-                    "type": "quantitative",
-                    "field": "upper"
+                    "field": "upper",
+                    "type": "quantitative"
                 },
                 "y2": {
                     "field": "lower"
                 }
-            },
-            "height": 200,
-            "width": 600
+            }
         }, {
-            "mark": "rule",
+            "mark": {
+                "type": "rule",
+                "color": "red"
+            },
             "encoding": {
                 "y": {
-                    "type": "quantitative",
-                    "field": "zero"
+                    "field": "zero",
+                    "type": "quantitative"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "temporal",
                     "field": "pre_period_end",
                     "scale": {
                         "domain": {
-                            "selection": "selector001"
+                            "param": "param_0"
                         }
-                    }
+                    },
+                    "type": "temporal"
                 }
             }
         }, {
             "mark": {
                 "type": "rule",
+                "color": "grey",
                 "strokeDash": [5, 5]
             },
             "encoding": {
-                "color": {
-                    "value": "grey"
-                },
                 "x": {
-                    "type": "temporal",
                     "field": "post_period_start",
                     "scale": {
                         "domain": {
-                            "selection": "selector001"
+                            "param": "param_0"
                         }
-                    }
+                    },
+                    "type": "temporal"
                 }
             }
-        }]
+        }],
+        "height": 200,
+        "width": 600
     },
     "resolve": {
         "scale": {
@@ -675,35 +676,45 @@ expected_bot_dict = {
 }
 
 expected_legend_dict = {
-    "mark": "point",
+    "mark": {
+        "type": "point"
+    },
     "encoding": {
         "color": {
             "condition": {
-                "type": "nominal",
+                "param": "param_1",
                 "field": "stat_pretty",
                 "legend": None,
-                "selection": "selector002"
+                "type": "nominal"
             },
             "value": "lightgray"
         },
         "y": {
-            "type": "nominal",
             "axis": {
                 "orient": "right"
             },
             "field": "stat_pretty",
-            "title": ""
+            "title": "",
+            "type": "nominal"
         }
     },
-    "selection": {
-        "selector002": {
-            "type": "multi",
-            "fields": ["stat_pretty"]
-        }
-    }
+    "name": "view_1"
 }
 
 
+def _with_stable_names(chart_dict):
+  """Renames altair's counter-based parameter and view names by position."""
+  params = chart_dict["params"]
+  names = {param["name"]: f"param_{i}" for i, param in enumerate(params)}
+  views = dict.fromkeys(view for param in params for view in param["views"])
+  names.update({view: f"view_{i}" for i, view in enumerate(views)})
+  # Rename in a single pass so that a new name is never renamed again.
+  chart_json = re.sub("|".join(f'"{re.escape(name)}"' for name in names),
+                      lambda m: f'"{names[m.group()[1:-1]]}"',
+                      json.dumps(chart_dict))
+  return json.loads(chart_json)
+
+
 class PlotTest(parameterized.TestCase):
 
   @classmethod
@@ -745,20 +756,26 @@ class PlotTest(parameterized.TestCase):
         "cumulative_effects_upper", "cumulative_effects_std"
     ]
     df.index = time_index
+    # Two chains of draws, as `fit_causalimpact` would report them.
+    convergence_diagnostics = {
+        "sigma": np.random.default_rng(0).normal(size=(2, 20))
+    }
     series_1 = df.copy()
     series_1["pre_period_start"] = series_1.index[0]
     series_1["pre_period_end"] = series_1.index[3]
     series_1["post_period_start"] = series_1.index[4]
     series_1["post_period_end"] = series_1.index[-1]
     cls.ci_data_1 = ci.CausalImpactAnalysis(
-        series=series_1, summary=pd.DataFrame(), posterior_samples=[])
+        series=series_1, summary=pd.DataFrame(), posterior_samples=[],
+        convergence_diagnostics=convergence_diagnostics)
     series_2 = df.copy()
     series_2["pre_period_start"] = series_2.index[0]
     series_2["pre_period_end"] = series_2.index[3]
     series_2["post_period_start"] = series_2.index[6]
     series_2["post_period_end"] = series_2.index[-1]
     cls.ci_data_2 = ci.CausalImpactAnalysis(
-        series=series_2, summary=pd.DataFrame(), posterior_samples=[])
+        series=series_2, summary=pd.DataFrame(), posterior_samples=[],
+        convergence_diagnostics=convergence_diagnostics)
 
     # This is constructed to have start and end of pre-period and post-period
     # drawn by having a point before/intbetween/after each of them.
@@ -768,7 +785,8 @@ class PlotTest(parameterized.TestCase):
     series_4["post_period_start"] = series_4.index[6]
     series_4["post_period_end"] = series_4.index[-2]
     cls.ci_data_4 = ci.CausalImpactAnalysis(
-        series=series_4, summary=pd.DataFrame(), posterior_samples=[])
+        series=series_4, summary=pd.DataFrame(), posterior_samples=[],
+        convergence_diagnostics=convergence_diagnostics)
 
     series_integer_index = df.copy()
     series_integer_index.index = pd.RangeIndex(stop=n_time_points)
@@ -779,11 +797,13 @@ class PlotTest(parameterized.TestCase):
     cls.ci_data_integer_index = ci.CausalImpactAnalysis(
         series=series_integer_index,
         summary=pd.DataFrame(),
-        posterior_samples=[])
+        posterior_samples=[],
+        convergence_diagnostics=convergence_diagnostics)
 
   def testCreatePlotComponentDF_lines(self):
+    series = self.ci_data_1.series
     lines_df = _create_plot_component_df(
-        self.ci_data_1.series, component="lines")
+        series.assign(time=series.index), component="lines")
     expected_cols = [
         "time", "post_period_start", "post_period_end", "pre_period_start",
         "pre_period_end", "value", "scale", "stat"
@@ -803,8 +823,9 @@ class PlotTest(parameterized.TestCase):
       },
   ])
   def testCreatePlotComponentDF_bands(self, component, method):
+    series = self.ci_data_2.series
     bands_df = _create_plot_component_df(
-        self.ci_data_2.series, component=component)
+        series.assign(time=series.index), component=component)
     expected_cols = [
         "time", "post_period_start", "post_period_end", "pre_period_start",
         "pre_period_end", "lower", "upper", "scale", "band_method"
@@ -816,16 +837,127 @@ class PlotTest(parameterized.TestCase):
     # method is given.
     self.assertEqual(bands_df["band_method"].unique(), method)
 
+  def testCreatePlotDF_matplotlib(self):
+    plot_df = _create_plot_df(self.ci_data_1.series, backend="matplotlib")
+    for col in ["zero", "scale_pretty", "stat_pretty"]:
+      self.assertNotIn(col, plot_df.columns)
+    self.assertIn("stat_pretty", _create_plot_df(self.ci_data_1.series).columns)
+
+  def testCreatePlotDF_categoricalLabels(self):
+    plot_df = _create_plot_df(self.ci_data_1.series)
+    for col in ["scale_pretty", "stat_pretty"]:
+      self.assertIsInstance(plot_df[col].dtype, pd.CategoricalDtype)
+
+  def testCreatePlotDF_groupedByScale(self):
+    plot_df = _create_plot_df(self.ci_data_1.series)
+    codes = plot_df["scale_pretty"].cat.codes.to_numpy()
+    self.assertTrue(np.all(np.diff(codes) >= 0))
+    self.assertTrue(
+        np.all(plot_df["scale"].to_numpy()[codes == 0] == "original"))
+
+  def testAltairData(self):
+    plot_df = _altair_data(_create_plot_df(self.ci_data_1.series))
+    self.assertNotIn("band_method", plot_df.columns)
+    self.assertIn("stat_pretty", plot_df.columns)
+    self.assertEqual(plot_df["value"].dtype, np.float64)
+    vegafusion_df = _altair_data(
+        _create_plot_df(self.ci_data_1.series), vegafusion=True)
+    self.assertEqual(vegafusion_df["value"].dtype, np.float32)
+
+  def testDrawClassicPlot(self):
+    plot_df = _create_plot_df(self.ci_data_1.series)
+    plot_df = plot_df.loc[(plot_df["band_method"] != "std")
+                          & (plot_df["stat"] != "median")]
+    chart_dict = _draw_classic_plot(plot_df).to_dict()
+    self.assertEqual(chart_dict["facet"]["row"]["field"], "scale_pretty")
+    # Lines, band, zero line and the post-period start rule.
+    self.assertLen(chart_dict["spec"]["layer"], 4)
+    self.assertEqual(chart_dict["config"]["header"]["labelFontSize"], 20)
+
+  def testCreateYAxisFormatter(self):
+    millions = _create_y_axis_formatter("millions", " units")
+    self.assertEqual(millions(2.5e6, 0), "2.5 units")
+    self.assertEqual(_create_y_axis_formatter("thousands", "")(1500, 0), "1.5")
+    self.assertEqual(_create_y_axis_formatter(None, "$")(3, 0), "3$")
+    # Formatters are cached on (format_option, unit).
+    self.assertIs(millions, _create_y_axis_formatter("millions", " units"))
+    # Unhashable arguments fall back to an uncached formatter.
+    self.assertEqual(_create_y_axis_formatter(["millions"], "$")(3, 0), "3$")
+
+  def testPlotOpts(self):
+    opts = _PlotOpts.from_plot_options({"chart_width": 400, "alpha": 0.1})
+    self.assertEqual(opts.chart_width, 400)
+    self.assertEqual(opts.chart_height, 600)
+    self.assertEqual(opts.x_label, "Time")
+    self.assertFalse(hasattr(opts, "alpha"))
+
   def testPlotMatplotlib(self):
     # Create plot object and use to_dict() to convert the plot components into
     # a more easily queried dict.
-    fig = ci.plot(self.ci_data_1, backend="matplotlib")
+    fig = ci.plot(self.ci_data_1, False, backend="matplotlib")
     self.assertIsNotNone(fig)
 
+  def testUpdateFig(self):
+    plot_df = _create_plot_df(self.ci_data_1.series)
+    plot_df = plot_df.loc[plot_df["band_method"] != "std"]
+    fig, artists = _build_fig(plot_df)
+    ylim = artists["axes"][0].get_ylim()
+
+    scaled_df = plot_df.copy()
+    scaled_df[["value", "lower", "upper"]] *= 10
+    _update_fig(fig, artists, scaled_df)
+    mean_segment = artists["mean_line"].get_segments()[0]
+    np.testing.assert_allclose(
+        mean_segment[:, 1],
+        10 * self.ci_data_1.series["posterior_mean"].to_numpy())
+    self.assertGreater(artists["axes"][0].get_ylim()[1], ylim[1])
+
+  def testPlotReuseFigure(self):
+    fig = ci.plot(self.ci_data_1, False, backend="matplotlib",
+                  reuse_figure=True)
+    band = next(c for c in fig.axes[0].collections
+                if isinstance(c, PolyCollection))
+    quantile_verts = band.get_paths()[0].vertices.copy()
+
+    # Switching to std intervals only changes the drawn rows, so the figure is
+    # updated in place.
+    self.assertIs(
+        fig,
+        ci.plot(self.ci_data_1, False, backend="matplotlib", reuse_figure=True,
+                use_std_intervals=True))
+    self.assertFalse(
+        np.allclose(quantile_verts, band.get_paths()[0].vertices))
+
+  def testVegaChartToDict(self):
+    spec = {"$schema": "https://vega.github.io/schema/vega/v5.json"}
+    chart = _VegaChart(spec)
+    self.assertIs(chart.to_dict(), spec)
+    self.assertIs(chart.to_dict(validate=False, format="vega"), spec)
+
+  def testPlotCache(self):
+    chart = ci.plot(self.ci_data_1, False, cache=True, backend="altair")
+    self.assertIs(
+        chart, ci.plot(self.ci_data_1, False, cache=True, backend="altair"))
+    self.assertIsNot(
+        chart,
+        ci.plot(self.ci_data_1, False, cache=True, backend="altair",
+                chart_width=300))
+    # Caching is opt-in.
+    self.assertIsNot(chart, ci.plot(self.ci_data_1, False, backend="altair"))
+    # Unhashable options are never cached.
+    unhashable = {
+        "y_labels": np.array(["Observed", "Pointwise Effect", "Cumulative"])
+    }
+    self.assertIsNot(
+        ci.plot(self.ci_data_1, False, cache=True, backend="altair",
+                **unhashable),
+        ci.plot(self.ci_data_1, False, cache=True, backend="altair",
+                **unhashable))
+
   def testClassicPlot_one_vline(self):
     # Create plot object and use to_dict() to convert the plot components into
     # a more easily queried dict.
-    classic_plot_dict = ci.plot(self.ci_data_1).to_dict()
+    classic_plot_dict = ci.plot(self.ci_data_1, False, backend="altair").to_dict()
 
     # Check the important elements: that facets are mapped to the correct
     # variable, the plot layers (lines, bands, etc) have the correct specs, and
@@ -840,7 +972,7 @@ class PlotTest(parameterized.TestCase):
   def testClassicPlot_one_vline_integer_index(self):
     # Create plot object and use to_dict() to convert the plot components into
     # a more easily queried dict.
-    classic_plot_dict = ci.plot(self.ci_data_integer_index).to_dict()
+    classic_plot_dict = ci.plot(self.ci_data_integer_index, False, backend="altair").to_dict()
 
     # Check the important elements: that facets are mapped to the correct
     # variable, the plot layers (lines, bands, etc) have the correct specs, and
@@ -855,7 +987,7 @@ class PlotTest(parameterized.TestCase):
   def testClassicPlot_two_vlines(self):
     # Create plot object and use to_dict() to convert the plot components into
     # a more easily queried dict.
-    classic_plot_dict = ci.plot(self.ci_data_2).to_dict()
+    classic_plot_dict = ci.plot(self.ci_data_2, False, backend="altair").to_dict()
 
     # Check the important elements: that facets are mapped to the correct
     # variable, the plot layers (lines, bands, etc) have the correct specs, and
@@ -869,7 +1001,7 @@ class PlotTest(parameterized.TestCase):
   def testClassicPlot_four_vlines(self):
     # Create plot object and use to_dict() to convert the plot components into
     # a more easily queried dict.
-    classic_plot_dict = ci.plot(self.ci_data_4).to_dict()
+    classic_plot_dict = ci.plot(self.ci_data_4, False, backend="altair").to_dict()
 
     # Check the important elements: that facets are mapped to the correct
     # variable, the plot layers (lines, bands, etc) have the correct specs, and
@@ -884,7 +1016,8 @@ class PlotTest(parameterized.TestCase):
 
     # Create plot object and use to_dict() to convert the plot components into
     # a more easily queried dict.
-    interactive_plot_dict = ci.plot(self.ci_data_2, static_plot=False).to_dict()
+    interactive_plot_dict = _with_stable_names(ci.plot(
+        self.ci_data_2, False, backend="altair", static_plot=False).to_dict())
 
     # Extract the relevant subdictionaries. Remove the `data` elements since
     # we don't need to check those.
@@ -45,10 +45,22 @@ class Scaler:
     self._is_fit = True
     return self
 
-  def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+  def transform(self, df: pd.DataFrame, dtype=None) -> pd.DataFrame:
+    """Standardizes `df`, returning `dtype` values if it is given."""
     if not self._is_fit:
       raise NotFittedError(
           "Must call `.fit(df)` before using Scaler to transform!")
+    if dtype is not None:
+      # Scale a private float64 copy in place, multiplying by the reciprocal
+      # standard deviations, and only cast the standardized result: casting
+      # first loses the digits of series with a large level. Constant columns
+      # are shifted by 0 and scaled by 1, which passes them through as above.
+      values = df.to_numpy(dtype=np.float64, copy=True)
+      is_scaled = self.stddev_ > 0
+      values -= np.where(is_scaled, self.mean_, 0)
+      values *= 1 / np.where(is_scaled, self.stddev_, 1)
+      return pd.DataFrame(
+          values.astype(dtype, copy=False), index=df.index, columns=df.columns)
     return pd.DataFrame(
         np.where(self.stddev_ > 0, (df - self.mean_) / self.stddev_, df),
         index=df.index,
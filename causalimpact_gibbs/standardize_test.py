@@ -55,6 +55,32 @@ class StandardizeTest(absltest.TestCase):
     pd.testing.assert_frame_equal(
         expected_df, standardize.Scaler().fit_transform(df))
 
+  def testTransformToDtype(self):
+    df = pd.DataFrame({
+        'x1': [4., 5., 6.],
+        'x2': [1., 1., 1.],
+    })
+    standardized_df = standardize.Scaler().fit(df).transform(
+        df, dtype=np.float32)
+
+    # Constant columns are passed through, as without a dtype.
+    pd.testing.assert_frame_equal(
+        pd.DataFrame({
+            'x1': np.float32([-1., 0., 1.]),
+            'x2': np.float32([1., 1., 1.]),
+        }), standardized_df)
+
+  def testTransformToDtypeWithLargeLevel(self):
+    # Casting to float32 before subtracting the mean would round the values
+    # of a series with a large level to a fraction of its spread.
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'y': 5e7 + 3. * rng.standard_normal(100)})
+    scaler = standardize.Scaler().fit(df)
+
+    np.testing.assert_allclose(
+        scaler.transform(df, dtype=np.float32)['y'].to_numpy(),
+        scaler.transform(df)['y'].to_numpy(), atol=1e-5)
+
   def testDataFrameWithDateIndexMaintainsIndex(self):
     df = pd.DataFrame({
         'x1': [4., 5., 6.],